@@ -5,7 +5,7 @@ from typing import Any
 from bs4 import BeautifulSoup, Tag
 
 from quarry.connectors.base import Raw
-from quarry.lib.bs4_utils import attr_str
+from quarry.lib.bs4_utils import attr_str, compile_selector
 from quarry.lib.http import get_html
 
 
@@ -135,11 +135,11 @@ class GenericConnector:
                     return attr_str(element, attr_name)
                 else:
                     # Extract from child
-                    child = element.select_one(child_selector)
+                    child = compile_selector(child_selector).select_one(element)
                     return attr_str(child, attr_name) if isinstance(child, Tag) else ""
 
             # Text extraction
-            child = element.select_one(selector)
+            child = compile_selector(selector).select_one(element)
             return child.get_text(strip=True) if child else ""
 
         except Exception as e:
@@ -1,6 +1,7 @@
 """NWS alerts connector."""
 
 import warnings
+from itertools import islice
 from pathlib import Path
 from typing import Any, cast
 
@@ -53,17 +54,16 @@ class NWSConnector:
 
         records = self.list_parser(html)
 
-        # Apply cursor filtering
+        # Apply cursor filtering: index ids once (first occurrence wins) so the
+        # cursor lookup is a dict hit rather than a linear scan
+        stop = len(records)
         if cursor:
-            seen_index = None
+            id_to_index: dict[Any, int] = {}
             for i, rec in enumerate(records):
-                if rec.get("id") == cursor:
-                    seen_index = i
-                    break
-            if seen_index is not None:
-                records = records[:seen_index]
+                id_to_index.setdefault(rec.get("id"), i)
+            stop = id_to_index.get(cursor, stop)
 
-        records = records[:max_items]
+        records = list(islice(records, min(stop, max_items)))
         next_cursor = records[0].get("id") if records else None
         return records, next_cursor
 
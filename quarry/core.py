@@ -1,6 +1,9 @@
 """Core job loading and execution logic."""
 
+import copy
+import os
 import warnings
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
@@ -36,6 +39,9 @@ _TRANSFORM_REGISTRY: dict[str, Any] = {
     "generic": generic_transforms.normalize,
 }
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _resolve_connector(
     source: dict[str, Any], policy: dict[str, Any], offline: bool, config: dict[str, Any]
@@ -70,10 +76,14 @@ def _apply_transform_pipeline(records: list[dict[str, Any]], transform: dict[str
 
     Separated to reduce branching in run_job.
     """
-    df = pd.DataFrame(records)
-    if df.empty:
-        return df
-
+    if not records:
+        return pd.DataFrame()
+    if not any(records):
+        # Records without any fields have nothing to normalize
+        return pd.DataFrame(records)
+
+    # Only build a frame from the raw records when no normalize step produces one
+    df = None
     pipeline = transform.get("pipeline", [])
     for step in pipeline:
         if "normalize" in step:
@@ -85,7 +95,7 @@ def _apply_transform_pipeline(records: list[dict[str, Any]], transform: dict[str
                 )
             df = normalize_func(records)
 
-    return df
+    return df if df is not None else pd.DataFrame(records)
 
 
 def _create_sink(sink_spec: dict[str, Any], timezone: str, job_name: str) -> Sink:
@@ -108,11 +118,19 @@ def _create_sink(sink_spec: dict[str, Any], timezone: str, job_name: str) -> Sin
     return sink
 
 
+@lru_cache(maxsize=128)
+def _read_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; mtime and size are part of the cache key so edits are picked up."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 def load_yaml(path: str) -> dict[str, Any]:
     """Load and validate minimal YAML job spec schema."""
     try:
-        with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        stat = os.stat(path)
+        # Callers may mutate the spec, so hand out a copy of the cached parse
+        data = copy.deepcopy(_read_yaml(os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
     except FileNotFoundError as err:
         raise FileNotFoundError(f"Job file not found: {path}") from err
     except yaml.YAMLError as err:
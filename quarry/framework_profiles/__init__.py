@@ -1,8 +1,22 @@
 """Framework-specific HTML structure profiles for better field detection."""
 
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any
+
 from bs4 import Tag
 
-from .base import FrameworkProfile, _get_element_classes
+from .base import (
+    FrameworkProfile,
+    _get_element_classes,
+    build_item_tree,
+    contains_any_marker,
+    fold_ascii_case,
+    scan_markers,
+)
 from .cms import DrupalViewsProfile, WordPressProfile
 from .css import BootstrapProfile, TailwindProfile
 from .ecommerce import ShopifyProfile, WooCommerceProfile
@@ -34,6 +48,67 @@ FRAMEWORK_PROFILES: list[type[FrameworkProfile]] = [
     WordPressProfile,  # Generic CMS (might match "post" class from others)
 ]
 
+# Recent detection results, keyed by page digest, item classes and registry
+_DETECTION_CACHE: OrderedDict[tuple[Any, ...], tuple[tuple[type[FrameworkProfile], int], ...]] = (
+    OrderedDict()
+)
+_DETECTION_CACHE_SIZE = 16
+_DETECTION_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _marker_union(profiles: tuple[type[FrameworkProfile], ...]) -> tuple[str, ...]:
+    """Union of every profile's literal markers, scanned once per page."""
+    return tuple(dict.fromkeys(marker for profile in profiles for marker in profile.markers))
+
+
+def _score_profiles(
+    html: str, item_element: Tag | None
+) -> tuple[tuple[type[FrameworkProfile], int], ...]:
+    """
+    Score every registered profile against a page, memoizing recent pages.
+
+    Profiles only look at the page text and the item's classes, so those
+    (plus the registry itself) make up the cache key.
+
+    Args:
+        html: Full page HTML
+        item_element: Optional item container element
+
+    Returns:
+        (profile_class, score) tuples in registry order
+    """
+    profiles = tuple(FRAMEWORK_PROFILES)
+    digest = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    item_classes = None if item_element is None else _get_element_classes(item_element)
+    key = (digest, item_classes, profiles)
+
+    with _DETECTION_LOCK:
+        cached = _DETECTION_CACHE.get(key)
+        if cached is not None:
+            _DETECTION_CACHE.move_to_end(key)
+            return cached
+
+    found = scan_markers(html, _marker_union(profiles))
+    # Fold letter case once for every profile's case-insensitive checks
+    folded = fold_ascii_case(html)
+    # Tokenize the item's classes once for every profile's class checks
+    class_set = None if item_classes is None else frozenset(item_classes.split())
+    scores = tuple(
+        (
+            profile_class,
+            profile_class.detect(
+                html, item_element, found=found, item_classes=class_set, folded=folded
+            ),
+        )
+        for profile_class in profiles
+    )
+    with _DETECTION_LOCK:
+        _DETECTION_CACHE[key] = scores
+        if len(_DETECTION_CACHE) > _DETECTION_CACHE_SIZE:
+            _DETECTION_CACHE.popitem(last=False)
+    return scores
+
 
 def detect_framework(html: str, item_element: Tag | None = None) -> type[FrameworkProfile] | None:
     """
@@ -49,8 +124,7 @@ def detect_framework(html: str, item_element: Tag | None = None) -> type[Framewo
     best_score = 0
     best_profile = None
 
-    for profile_class in FRAMEWORK_PROFILES:
-        score = profile_class.detect(html, item_element)
+    for profile_class, score in _score_profiles(html, item_element):
         if score > best_score:
             best_score = score
             best_profile = profile_class
@@ -73,15 +147,14 @@ def detect_all_frameworks(
         List of (profile_class, score) tuples sorted by score (highest first).
         Only includes profiles with score > 0.
     """
-    results = []
-
-    for profile_class in FRAMEWORK_PROFILES:
-        score = profile_class.detect(html, item_element)
-        if score > 0:
-            results.append((profile_class, score))
+    results = [
+        (profile_class, score)
+        for profile_class, score in _score_profiles(html, item_element)
+        if score > 0
+    ]
 
     # Sort by score descending
-    results.sort(key=lambda x: x[1], reverse=True)
+    results.sort(key=itemgetter(1), reverse=True)
     return results
 
 
@@ -89,6 +162,7 @@ def get_framework_field_selector(
     framework: type[FrameworkProfile],
     item_element: Tag,
     field_type: str,
+    tree: Any = None,
 ) -> str | None:
     """
     Get field selector using framework-specific knowledge.
@@ -97,11 +171,12 @@ def get_framework_field_selector(
         framework: Framework profile class
         item_element: Item container element
         field_type: Field type to detect
+        tree: Optional ``build_item_tree`` mirror of item_element, shared across fields
 
     Returns:
         CSS selector string or None
     """
-    return framework.generate_field_selector(item_element, field_type)
+    return framework.generate_field_selector(item_element, field_type, tree)
 
 
 def is_framework_pattern(selector: str, framework: type[FrameworkProfile] | None) -> bool:
@@ -118,20 +193,16 @@ def is_framework_pattern(selector: str, framework: type[FrameworkProfile] | None
     if not framework:
         return False
 
-    # Check if selector matches any container pattern
-    for pattern in framework.get_item_selector_hints():
-        if pattern in selector or selector in pattern:
-            return True
-
-    # Check if selector matches any field mapping pattern
-    for field_patterns in framework.get_field_mappings().values():
-        for pattern in field_patterns:
-            # Remove ::attr() suffix for comparison
-            base_pattern = pattern.split("::attr(")[0] if "::attr(" in pattern else pattern
-            if base_pattern in selector or selector in base_pattern:
-                return True
-
-    return False
+    # Container hints and field mapping patterns, built once per profile
+    patterns = framework._known_patterns()
+    # Selectors taken straight from a profile are the common case: one hash lookup
+    if selector in patterns:
+        return True
+    markers, joined = framework._pattern_index()
+    # A NUL-free selector is a substring of some pattern iff it occurs in the joined string
+    if markers and "\0" not in selector and selector in joined:
+        return True
+    return contains_any_marker(selector, markers)
 
 
 __all__ = [
@@ -150,8 +221,11 @@ __all__ = [
     "WooCommerceProfile",
     "WordPressProfile",
     "_get_element_classes",
+    "build_item_tree",
+    "contains_any_marker",
     "detect_all_frameworks",
     "detect_framework",
     "get_framework_field_selector",
     "is_framework_pattern",
+    "scan_markers",
 ]
@@ -1,7 +1,172 @@
 """Base class for framework-specific detection profiles."""
 
+from functools import cache, lru_cache
+from typing import Any, ClassVar
+
 from bs4 import Tag
 
+# Optional C extension: one Aho-Corasick pass finds every marker at once
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
+# Optional: evaluate field patterns as compiled XPath instead of bs4 tree walks
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - depends on environment
+    etree = None
+
+# Parsed field pattern: (pattern, kind, name, value, child, child_href)
+_CompiledPattern = tuple[str, str, str | None, str | None, str | None, bool]
+
+# Below this many markers, CPython's substring search beats an automaton pass
+_AUTOMATON_MIN_MARKERS = 8
+
+
+@lru_cache(maxsize=64)
+def _build_automaton(markers: tuple[str, ...]) -> Any:
+    automaton = ahocorasick.Automaton()
+    for marker in markers:
+        automaton.add_word(marker, marker)
+    automaton.make_automaton()
+    return automaton
+
+
+def scan_markers(html: str, markers: tuple[str, ...]) -> frozenset[str]:
+    """
+    Find which literal markers occur anywhere in the page.
+
+    Args:
+        html: Full page HTML
+        markers: Substrings to look for
+
+    Returns:
+        The subset of ``markers`` present in ``html``
+    """
+    if ahocorasick is not None and len(markers) >= _AUTOMATON_MIN_MARKERS:
+        automaton = _build_automaton(markers)
+        return frozenset(marker for _, marker in automaton.iter(html))
+    return frozenset(marker for marker in markers if marker in html)
+
+
+def contains_any_marker(text: str, markers: tuple[str, ...]) -> bool:
+    """
+    Check whether any of the literal markers occurs in ``text``.
+
+    Equivalent to ``any(marker in text for marker in markers)``, but stops at
+    the first automaton hit instead of running one substring search per marker.
+
+    Args:
+        text: String to search
+        markers: Substrings to look for
+
+    Returns:
+        True if at least one marker is present
+    """
+    if ahocorasick is not None and len(markers) >= _AUTOMATON_MIN_MARKERS:
+        return next(_build_automaton(markers).iter(text), None) is not None
+    return any(marker in text for marker in markers)
+
+
+def fold_ascii_case(html: str) -> bytes:
+    """Lowercase the ASCII letters of a page, for contains_ignore_case()."""
+    # UTF-8 bytes >= 0x80 are never ASCII letters, so bytes.lower() folds exactly
+    # the characters an ASCII needle can match, without str.lower()'s Unicode pass
+    return html.encode("utf-8", "surrogatepass").lower()
+
+
+def contains_ignore_case(html: str, needle: str, folded: bytes | None = None) -> bool:
+    """
+    Check whether a lowercase ASCII needle occurs in the page, ignoring case.
+
+    Equivalent to ``needle in html.lower()``. Pass the page's fold_ascii_case()
+    bytes as ``folded`` so several profiles checking one page share a single pass.
+
+    Args:
+        html: Full page HTML
+        needle: Lowercase ASCII substring to look for
+        folded: fold_ascii_case(html), folded here when omitted
+
+    Returns:
+        True if the needle occurs in any letter case
+    """
+    if folded is None:
+        folded = fold_ascii_case(html)
+    return needle.encode("ascii") in folded
+
+
+_CLASS_TEST = "contains(concat(' ', normalize-space(@class), ' '), $cls)"
+_ASCII_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _element_test(name: str | None, class_name: str | None) -> str:
+    """Build an XPath step matching what ``_find_tag`` would match."""
+    tests = []
+    if name is not None:
+        tests.append("name() = $name")
+    if class_name is not None:
+        tests.append(_CLASS_TEST)
+    return f"*[{' and '.join(tests)}]" if tests else "*"
+
+
+@lru_cache(maxsize=64)
+def _entry_xpath(kind: str, has_name: bool, has_class: bool, child_href: bool) -> Any:
+    """Compile the parameterised XPath used to evaluate one kind of field pattern."""
+    test = _element_test("" if has_name else None, "" if has_class else None)
+    if kind == "find":
+        expr = f".//{test}"
+    elif kind == "child":
+        # Only the first matching parent is checked, as with bs4's find()
+        child = "a[@href]" if child_href else "*[name() = $child]"
+        expr = f"(.//{test})[1]//{child}"
+    elif kind == "contains":
+        expr = (
+            ".//*[contains(translate(@*[name() = $name], "
+            f"'{_ASCII_UPPER}', '{_ASCII_UPPER.lower()}'), $value)]"
+        )
+    else:
+        expr = ".//*[@*[name() = $name]]"
+    return etree.XPath(f"boolean({expr})")
+
+
+def build_item_tree(item_element: Tag) -> Any:
+    """
+    Mirror an item's element structure and attributes as an lxml tree.
+
+    The tree is built from the bs4 nodes directly (no re-parse), so both sides
+    see the same structure. Build it once per item and pass it to
+    ``generate_field_selector`` for each field. Returns None without lxml.
+    """
+    if etree is None:
+        return None
+    root = etree.Element("item")
+    nodes = {id(item_element): root}
+    for node in item_element.descendants:
+        if not isinstance(node, Tag):
+            continue
+        parent = nodes[id(node.parent)]
+        try:
+            element = etree.SubElement(parent, node.name)
+        except ValueError:
+            # Not a valid XML name (e.g. "o:p"); no field pattern targets these
+            element = etree.SubElement(parent, "_")
+        for attr_name, attr_value in node.attrs.items():
+            text = " ".join(attr_value) if isinstance(attr_value, list) else str(attr_value)
+            try:
+                element.set(attr_name, text)
+            except ValueError:
+                continue  # Vue-style "@click"/":key" names are not valid XML
+        nodes[id(node)] = element
+    return root
+
+
+def _find_tag(element: Tag, name: str | None, class_name: str | None) -> Tag | None:
+    """Find the first descendant by tag name and/or class (bs4 treats class_=None as a filter)."""
+    if class_name is None:
+        return element.find(name)
+    return element.find(name, class_=class_name)
+
 
 def _get_element_classes(element: Tag) -> str:
     """
@@ -21,19 +186,49 @@ def _get_element_classes(element: Tag) -> str:
     return str(classes)
 
 
+def _get_element_class_set(element: Tag) -> frozenset[str]:
+    """
+    Get element's individual class tokens as a set.
+
+    Args:
+        element: BeautifulSoup Tag element
+
+    Returns:
+        Set of class names (empty if the element has no classes)
+    """
+    return frozenset(_get_element_classes(element).split())
+
+
 class FrameworkProfile:
     """Base class for framework-specific detection profiles."""
 
     name: str = "generic"
 
+    # Literal substrings detect() looks for in the page HTML
+    markers: ClassVar[tuple[str, ...]] = ()
+
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """
         Detect if this framework is being used with confidence scoring.
 
         Args:
             html: Full page HTML
             item_element: Optional item container element
+            found: Markers already known to be present in ``html`` (from
+                scan_markers); scanned from ``html`` when omitted
+            item_classes: Class tokens of ``item_element``, when the caller
+                already has them; read from the element when omitted
+            folded: ``fold_ascii_case(html)``, computed once per detection pass
+                for contains_ignore_case(); folded from ``html`` when omitted
 
         Returns:
             Confidence score (0-100). 0 = not detected, 100 = very confident.
@@ -62,124 +257,162 @@ class FrameworkProfile:
         return {}
 
     @classmethod
-    def generate_field_selector(cls, item_element: Tag, field_type: str) -> str | None:
+    @cache
+    def _known_patterns(cls) -> frozenset[str]:
+        """
+        Item selector hints and field mapping patterns, once per profile.
+
+        Returns:
+            Set of patterns with any ``::attr()`` suffix removed
+        """
+        field_patterns = (
+            pattern.split("::attr(")[0]
+            for patterns in cls.get_field_mappings().values()
+            for pattern in patterns
+        )
+        return frozenset((*cls.get_item_selector_hints(), *field_patterns))
+
+    @classmethod
+    @cache
+    def _pattern_index(cls) -> tuple[tuple[str, ...], str]:
+        """
+        Known patterns laid out for substring checks, once per profile.
+
+        Returns:
+            The patterns as a marker tuple (for ``pattern in selector``) and
+            NUL-joined into one string (for ``selector in pattern``)
+        """
+        patterns = tuple(cls._known_patterns())
+        return patterns, "\0".join(patterns)
+
+    @classmethod
+    @cache
+    def _compiled_mappings(cls) -> dict[str, tuple[_CompiledPattern, ...]]:
+        """
+        Parse every field mapping pattern into bs4 lookup arguments, once per profile.
+
+        Returns:
+            Dict mapping field types to ``(pattern, kind, name, value, child, child_href)``
+            tuples, where ``kind`` selects how ``generate_field_selector`` evaluates them
+        """
+        compiled: dict[str, tuple[_CompiledPattern, ...]] = {}
+        for field_type, patterns in cls.get_field_mappings().items():
+            entries: list[_CompiledPattern] = []
+            for pattern in patterns:
+                # Strip ::attr() suffix - only the element part is matched
+                base_pattern = pattern.split("::attr(")[0].strip()
+                parts = base_pattern.split()
+
+                if base_pattern.startswith("."):
+                    # Class selector, optionally with a descendant (".class a")
+                    if len(parts) > 1:
+                        child_selector = " ".join(parts[1:])
+                        if child_selector.startswith("img"):
+                            child = "img"
+                        elif child_selector.startswith("time"):
+                            child = "time"
+                        else:
+                            child = parts[1]
+                        entries.append(
+                            (pattern, "child", None, parts[0][1:], child, child_selector == "a")
+                        )
+                    else:
+                        entries.append((pattern, "find", None, base_pattern[1:], None, False))
+                elif "." in base_pattern and not base_pattern.startswith("["):
+                    # tag.class patterns like "th.field-__str__"
+                    if len(parts) > 1:
+                        tag_name: str | None = None
+                        class_name = parts[0]
+                        if "." in class_name:
+                            tag_name, class_name = class_name.split(".", 1)
+                        child_href = parts[1:] == ["a"]
+                        entries.append(
+                            (pattern, "child", tag_name, class_name, parts[1], child_href)
+                        )
+                    else:
+                        tag_name, class_name = base_pattern.split(".", 1)
+                        entries.append((pattern, "find", tag_name, class_name, None, False))
+                elif base_pattern.startswith("["):
+                    # Attribute selector - simple implementation for common cases
+                    if "*=" in base_pattern:
+                        # Partial match selector like [class*='title']
+                        attr_name, search_value = base_pattern.split("*=")[:2]
+                        for char in "]'\"":
+                            search_value = search_value.replace(char, "")
+                        entries.append(
+                            (
+                                pattern,
+                                "contains",
+                                attr_name.replace("[", "").strip(),
+                                search_value.strip().lower(),
+                                None,
+                                False,
+                            )
+                        )
+                    elif "=" in base_pattern:
+                        attr_name = base_pattern.split("=")[0].replace("[", "").strip()
+                        entries.append((pattern, "has_attr", attr_name, None, None, False))
+                elif parts:
+                    # Tag selector - match on the first part
+                    entries.append((pattern, "find", parts[0], None, None, False))
+            compiled[field_type] = tuple(entries)
+        return compiled
+
+    @classmethod
+    def generate_field_selector(
+        cls, item_element: Tag, field_type: str, tree: Any = None
+    ) -> str | None:
         """
         Generate field selector using framework-specific knowledge.
 
         Args:
             item_element: Item container element
             field_type: Field type to detect
+            tree: The item's ``build_item_tree`` mirror, built here if omitted
 
         Returns:
             CSS selector string or None
         """
-        mappings = cls.get_field_mappings()
-        patterns = mappings.get(field_type, [])
-
-        for pattern in patterns:
-            # Handle ::attr() syntax for attribute extraction
-            has_attr = "::attr(" in pattern
-            if has_attr:
-                # Split pattern and attr
-                base_pattern = pattern.split("::attr(")[0].strip()
-                # attr_name = pattern.split("::attr(")[1].rstrip(")")
-            else:
-                base_pattern = pattern
-
-            # Try to find element matching pattern
-            if base_pattern.startswith("."):
-                # Class selector
-                class_name = base_pattern[1:].split()[0]  # Get first class if pattern has spaces
-
-                # Handle patterns like ".class a" (selector with descendant)
-                if " " in base_pattern:
-                    # Split into parent and child
-                    parts = base_pattern.split()
-                    parent_selector = parts[0][1:]  # Remove leading dot from first part
-                    child_selector = " ".join(parts[1:])
-
-                    # Find parent element
-                    parent = item_element.find(class_=parent_selector)
-                    if parent:
-                        # Check if child exists
-                        if child_selector == "a":
-                            if parent.find("a", href=True):
-                                return pattern  # Return original with ::attr if present
-                        elif child_selector.startswith("img"):
-                            if parent.find("img"):
-                                return pattern
-                        elif child_selector.startswith("time"):
-                            if parent.find("time"):
-                                return pattern
-                        # Try generic tag search
-                        elif parent.find(child_selector.split()[0]):
-                            return pattern
-                else:
-                    # Simple class selector
-                    elem = item_element.find(class_=class_name)
-                    if elem:
-                        return pattern
-            elif base_pattern.count(".") > 0 and not base_pattern.startswith("["):
-                # Handle tag.class patterns like "th.field-__str__"
-                if " " in base_pattern:
-                    # Complex selector with descendants
-                    parts = base_pattern.split()
-                    first_part = parts[0]
-
-                    # Parse tag.class
-                    if "." in first_part:
-                        tag_name, class_name = first_part.split(".", 1)
-                        parent = item_element.find(tag_name, class_=class_name)
-                    else:
-                        parent = item_element.find(class_=first_part)
+        entries = cls._compiled_mappings().get(field_type, ())
+        if entries and etree is not None:
+            if tree is None:
+                tree = build_item_tree(item_element)
+            for pattern, kind, name, value, child, child_href in entries:
+                xpath = _entry_xpath(kind, name is not None, value is not None, child_href)
+                if xpath(
+                    tree,
+                    name=name or "",
+                    cls=f" {value} ",
+                    value=value or "",
+                    child=child or "",
+                ):
+                    return pattern  # Return original with ::attr if present
+            return None
 
-                    if parent:
-                        # Check for descendant
-                        child_selector = " ".join(parts[1:])
-                        if child_selector == "a":
-                            if parent.find("a", href=True):
-                                return pattern
-                        elif parent.find(child_selector.split()[0]):
-                            return pattern
-                else:
-                    # Simple tag.class pattern
-                    tag_name, class_name = base_pattern.split(".", 1)
-                    elem = item_element.find(tag_name, class_=class_name)
-                    if elem:
-                        return pattern
-            elif base_pattern.startswith("["):
-                # Attribute selector - parse it
-                # Simple implementation for common cases
-                if "*=" in base_pattern:
-                    # Partial match selector like [class*='title']
-                    attr_name = base_pattern.split("*=")[0].replace("[", "").strip()
-                    search_value = (
-                        base_pattern.split("*=")[1]
-                        .replace("]", "")
-                        .replace("'", "")
-                        .replace('"', "")
-                        .strip()
-                    )
-
-                    # Find element with attribute containing value
-                    for elem in item_element.find_all():
-                        attr_val = elem.get(attr_name, "")
-                        if isinstance(attr_val, list):
-                            attr_val = " ".join(attr_val)
-                        if search_value.lower() in str(attr_val).lower():
-                            return pattern
-                elif "=" in base_pattern:
-                    attr_name = base_pattern.split("=")[0].replace("[", "").strip()
-                    elem = item_element.find(attrs={attr_name: True})
-                    if elem:
+        for pattern, kind, name, value, child, child_href in entries:
+            if kind == "find":
+                if _find_tag(item_element, name, value):
+                    return pattern
+            elif kind == "child":
+                parent = _find_tag(item_element, name, value)
+                if parent and (parent.find(child, href=True) if child_href else parent.find(child)):
+                    return pattern  # Return original with ::attr if present
+            elif kind == "contains":
+                # Find element with attribute containing value; walk lazily so
+                # the first hit stops the scan without materializing find_all()
+                assert name is not None and value is not None
+                for elem in item_element.descendants:
+                    if not isinstance(elem, Tag):
+                        continue
+                    attr_val = elem.get(name)
+                    if not attr_val:
+                        continue
+                    if isinstance(attr_val, list):
+                        attr_val = " ".join(attr_val)
+                    if value in str(attr_val).lower():
                         return pattern
-            else:
-                # Tag selector or more complex selector
-                # Try to find element by tag name
-                elem = item_element.find(
-                    base_pattern.split()[0]
-                )  # Get first part for tag selectors
-                if elem:
+            elif kind == "has_attr":
+                if item_element.find(attrs={name: True}):
                     return pattern
 
         return None
@@ -2,32 +2,45 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile, _get_element_classes
+from ..base import FrameworkProfile, _get_element_class_set, scan_markers
 
 
 class DrupalViewsProfile(FrameworkProfile):
     """Drupal Views module - very common for listing pages."""
 
     name = "drupal_views"
+    markers = ("views-row", "views-field", "view-content", "views-table")
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """Detect Drupal Views by looking for characteristic classes."""
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Check HTML content for views-specific markers
-        if "views-row" in html:
+        if "views-row" in found:
             score += 35
-        if "views-field" in html:
+        if "views-field" in found:
             score += 25
-        if "view-content" in html:
+        if "view-content" in found:
             score += 15
-        if "views-table" in html:
+        if "views-table" in found:
             score += 10
 
         # Check item element if provided
         if item_element:
-            classes = _get_element_classes(item_element)
+            classes = (
+                item_classes if item_classes is not None else _get_element_class_set(item_element)
+            )
             if "views-row" in classes:
                 score += 25
             if "views-field" in classes:
@@ -2,35 +2,54 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile, _get_element_classes
+from ..base import FrameworkProfile, _get_element_class_set, scan_markers
 
 
 class WordPressProfile(FrameworkProfile):
     """WordPress - extremely common CMS."""
 
     name = "wordpress"
+    markers = ("wp-content", "post-", "entry-", "hentry", "wp-includes")
+
+    # Item container classes (exact tokens, plus post-123 / entry-* style prefixes)
+    _ITEM_CLASSES = frozenset({"post", "entry", "hentry", "article"})
+    _ITEM_CLASS_PREFIXES = ("post-", "entry-")
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """Detect WordPress by looking for characteristic classes."""
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Check for WordPress-specific indicators
-        if "wp-content" in html:
+        if "wp-content" in found:
             score += 30
-        if "post-" in html:
+        if "post-" in found:
             score += 20
-        if "entry-" in html:
+        if "entry-" in found:
             score += 20
-        if "hentry" in html:
+        if "hentry" in found:
             score += 15
-        if "wp-includes" in html:
+        if "wp-includes" in found:
             score += 15
 
         # Check item element
         if item_element:
-            classes = _get_element_classes(item_element)
-            if any(indicator in classes for indicator in ["post", "entry", "hentry", "article"]):
+            classes = (
+                item_classes if item_classes is not None else _get_element_class_set(item_element)
+            )
+            if not cls._ITEM_CLASSES.isdisjoint(classes) or any(
+                c.startswith(cls._ITEM_CLASS_PREFIXES) for c in classes
+            ):
                 score += 20
 
         return min(score, 100)
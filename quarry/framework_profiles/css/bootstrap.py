@@ -2,37 +2,53 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile, _get_element_classes
+from ..base import FrameworkProfile, _get_element_class_set, scan_markers
 
 
 class BootstrapProfile(FrameworkProfile):
     """Bootstrap framework - very common for cards/listings."""
 
     name = "bootstrap"
+    markers = ("card", "list-group-item", "media", "row", "col", "btn-", "container")
+
+    # Component classes that mark an item container
+    _ITEM_CLASSES = frozenset({"card", "list-group-item", "media"})
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """Detect Bootstrap by looking for characteristic classes."""
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Bootstrap component indicators
-        if "card" in html:
+        if "card" in found:
             score += 25
-        if "list-group-item" in html:
+        if "list-group-item" in found:
             score += 25
-        if "media" in html:
+        if "media" in found:
             score += 15
-        if "row" in html and "col" in html:
+        if "row" in found and "col" in found:
             score += 15
-        if "btn-" in html:
+        if "btn-" in found:
             score += 10
-        if "container" in html:
+        if "container" in found:
             score += 10
 
         # Check item element
         if item_element:
-            classes = _get_element_classes(item_element)
-            if any(indicator in classes for indicator in ["card", "list-group-item", "media"]):
+            classes = (
+                item_classes if item_classes is not None else _get_element_class_set(item_element)
+            )
+            if not cls._ITEM_CLASSES.isdisjoint(classes):
                 score += 20
 
         return min(score, 100)
@@ -2,43 +2,52 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile
+from ..base import FrameworkProfile, scan_markers
 
 
 class TailwindProfile(FrameworkProfile):
     """Tailwind CSS - increasingly popular utility-first framework."""
 
     name = "tailwind"
+    markers = (
+        "flex",
+        "grid",
+        "space-y",
+        "gap-",
+        "p-",
+        "m-",
+        "text-",
+        "bg-",
+        "rounded",
+        "shadow",
+        "border-",
+        "hover:",
+        "dark:",
+        "sm:",
+        "md:",
+        "lg:",
+    )
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """
         Tailwind is harder to detect as it uses utility classes.
         Look for common patterns like flex, grid, space-y, etc.
         """
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
-        tailwind_patterns = [
-            "flex",
-            "grid",
-            "space-y",
-            "gap-",
-            "p-",
-            "m-",
-            "text-",
-            "bg-",
-            "rounded",
-            "shadow",
-            "border-",
-            "hover:",
-            "dark:",
-            "sm:",
-            "md:",
-            "lg:",
-        ]
-
         # Count pattern matches (need multiple since these are generic)
-        matches = sum(1 for pattern in tailwind_patterns if pattern in html)
+        matches = sum(1 for pattern in cls.markers if pattern in found)
 
         # Scale score based on matches (need at least 5 for confidence)
         if matches >= 10:
@@ -2,29 +2,40 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile
+from ..base import FrameworkProfile, contains_ignore_case, scan_markers
 
 
 class ShopifyProfile(FrameworkProfile):
     """Shopify e-commerce platform."""
 
     name = "shopify"
+    markers = ("product-", "collection-", "cart", "product", "variant")
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """Detect Shopify by looking for product/collection classes."""
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Shopify-specific indicators
-        if "product-" in html:
+        if "product-" in found:
             score += 30
-        if "collection-" in html:
+        if "collection-" in found:
             score += 25
-        if "shopify" in html.lower():
+        if contains_ignore_case(html, "shopify", folded):
             score += 25
-        if "cart" in html and "product" in html:
+        if "cart" in found and "product" in found:
             score += 10
-        if "variant" in html:
+        if "variant" in found:
             score += 10
 
         return min(score, 100)
@@ -2,7 +2,7 @@
 
 from bs4 import Tag
 
-from quarry.framework_profiles.base import FrameworkProfile
+from quarry.framework_profiles.base import FrameworkProfile, scan_markers
 
 
 class WooCommerceProfile(FrameworkProfile):
@@ -14,47 +14,78 @@ class WooCommerceProfile(FrameworkProfile):
     """
 
     name = "woocommerce"
+    markers = (
+        "woocommerce",
+        ".woocommerce ",
+        'class="woocommerce',
+        "product-card",
+        "wc-product",
+        "woocommerce-loop-product",
+        "product_title",
+        "woocommerce-product-title",
+        "wc-",
+        "woocommerce.js",
+        "woocommerce.min.js",
+        "woocommerce-Price-amount",
+        "price",
+        "amount",
+        "currency",
+        "add_to_cart",
+        "add-to-cart",
+        "wp-content",
+        "wp-includes",
+    )
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """
         Detect WooCommerce with confidence scoring.
 
         Returns:
             Confidence score 0-100. Threshold for detection is 40.
         """
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Strong WooCommerce indicators
-        if "woocommerce" in html:
+        if "woocommerce" in found:
             score += 30  # Class or namespace
-        if ".woocommerce " in html or "class=\"woocommerce" in html:
+        if ".woocommerce " in found or "class=\"woocommerce" in found:
             score += 20  # Actual class usage
 
         # Product-specific classes
-        if "product-card" in html or "wc-product" in html:
+        if "product-card" in found or "wc-product" in found:
             score += 25
-        if "woocommerce-loop-product" in html:
+        if "woocommerce-loop-product" in found:
             score += 30  # Product loop class
-        if "product_title" in html or "woocommerce-product-title" in html:
+        if "product_title" in found or "woocommerce-product-title" in found:
             score += 20
 
         # WooCommerce scripts/assets
-        if "wc-" in html or "woocommerce.js" in html or "woocommerce.min.js" in html:
+        if "wc-" in found or "woocommerce.js" in found or "woocommerce.min.js" in found:
             score += 15
 
         # Price elements
-        if "woocommerce-Price-amount" in html:
+        if "woocommerce-Price-amount" in found:
             score += 25
-        if "price" in html and ("amount" in html or "currency" in html):
+        if "price" in found and ("amount" in found or "currency" in found):
             score += 10
 
         # Add to cart elements
-        if "add_to_cart" in html or "add-to-cart" in html:
+        if "add_to_cart" in found or "add-to-cart" in found:
             score += 15
 
         # Check for WordPress + WooCommerce combination
-        if ("wp-content" in html or "wp-includes" in html) and "woocommerce" in html:
+        if ("wp-content" in found or "wp-includes" in found) and "woocommerce" in found:
             score += 20  # Boost if both WordPress and WooCommerce detected
 
         return score
@@ -2,31 +2,42 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile
+from ..base import FrameworkProfile, scan_markers
 
 
 class DjangoAdminProfile(FrameworkProfile):
     """Django Admin interface detection."""
 
     name = "django_admin"
+    markers = ("django-admin", "grp-", "suit-", "/admin/", "djdt", "field-", "th.field")
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """Detect Django Admin by looking for admin-specific classes and meta tags."""
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Django Admin indicators
-        if "django-admin" in html:
+        if "django-admin" in found:
             score += 40
-        if "grp-" in html:  # Django Grappelli
+        if "grp-" in found:  # Django Grappelli
             score += 30
-        if "suit-" in html:  # Django Suit
+        if "suit-" in found:  # Django Suit
             score += 30
-        if "/admin/" in html:
+        if "/admin/" in found:
             score += 20
-        if "djdt" in html:  # Django Debug Toolbar
+        if "djdt" in found:  # Django Debug Toolbar
             score += 15
-        if "field-" in html and "th.field" in html:
+        if "field-" in found and "th.field" in found:
             score += 20
 
         return min(score, 100)
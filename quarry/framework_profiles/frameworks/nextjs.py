@@ -2,29 +2,40 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile
+from ..base import FrameworkProfile, scan_markers
 
 
 class NextJSProfile(FrameworkProfile):
     """Next.js application detection."""
 
     name = "nextjs"
+    markers = ("__NEXT_DATA__", "__next", "data-nextjs", "/_next/", "next/script", "next/image")
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """Detect Next.js by looking for __NEXT_DATA__ and Next.js-specific attributes."""
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Next.js indicators
-        if "__NEXT_DATA__" in html:
+        if "__NEXT_DATA__" in found:
             score += 50
-        if "__next" in html:
+        if "__next" in found:
             score += 30
-        if "data-nextjs" in html:
+        if "data-nextjs" in found:
             score += 25
-        if "/_next/" in html:
+        if "/_next/" in found:
             score += 20
-        if "next/script" in html or "next/image" in html:
+        if "next/script" in found or "next/image" in found:
             score += 15
 
         return min(score, 100)
@@ -2,31 +2,52 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile
+from ..base import FrameworkProfile, scan_markers
 
 
 class ReactComponentProfile(FrameworkProfile):
     """Generic React application detection."""
 
     name = "react"
+    markers = (
+        "data-reactroot",
+        "data-react-",
+        "__REACT",
+        'id="root"',
+        'id="app"',
+        "data-react",
+        "React",
+        "react-dom",
+        "react.js",
+    )
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """Detect React by looking for data-react attributes and root div."""
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # React-specific indicators
-        if "data-reactroot" in html:
+        if "data-reactroot" in found:
             score += 40
-        if "data-react-" in html:
+        if "data-react-" in found:
             score += 35
-        if "__REACT" in html:
+        if "__REACT" in found:
             score += 30
-        if 'id="root"' in html:
+        if 'id="root"' in found:
             score += 20
-        if 'id="app"' in html and ("data-react" in html or "React" in html):
+        if 'id="app"' in found and ("data-react" in found or "React" in found):
             score += 15
-        if "react-dom" in html or "react.js" in html:
+        if "react-dom" in found or "react.js" in found:
             score += 25
 
         return min(score, 100)
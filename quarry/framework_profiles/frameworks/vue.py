@@ -2,31 +2,42 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile
+from ..base import FrameworkProfile, contains_ignore_case, scan_markers
 
 
 class VueJSProfile(FrameworkProfile):
     """Vue.js application detection."""
 
     name = "vuejs"
+    markers = ("v-for=", "v-if=", "v-bind:", ":key=", "@click=", "v-on:", "__VUE__", "vue@")
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """Detect Vue.js by looking for v- directives and Vue-specific attributes."""
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Vue.js indicators
-        if "v-for=" in html:
+        if "v-for=" in found:
             score += 45  # Increased from 35
-        if "v-if=" in html:
+        if "v-if=" in found:
             score += 30  # Increased from 25
-        if "v-bind:" in html or ":key=" in html:
+        if "v-bind:" in found or ":key=" in found:
             score += 25
-        if "@click=" in html or "v-on:" in html:
+        if "@click=" in found or "v-on:" in found:
             score += 20
-        if "__VUE__" in html:
+        if "__VUE__" in found:
             score += 30
-        if "vue.js" in html.lower() or "vue@" in html:
+        if contains_ignore_case(html, "vue.js", folded) or "vue@" in found:
             score += 25
 
         return min(score, 100)
@@ -1,9 +1,9 @@
 """Open Graph meta tag profile for social media metadata extraction."""
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import SoupStrainer, Tag
 
-from quarry.framework_profiles.base import FrameworkProfile
-from quarry.lib.bs4_utils import attr_str
+from quarry.framework_profiles.base import FrameworkProfile, scan_markers
+from quarry.lib.bs4_utils import attr_str, parse_html
 
 
 class OpenGraphProfile(FrameworkProfile):
@@ -16,15 +16,32 @@ class OpenGraphProfile(FrameworkProfile):
     """
 
     name = "opengraph"
+    markers = (
+        'property="og:title"',
+        'property="og:description"',
+        'property="og:image"',
+        'property="og:url"',
+        'property="og:type"',
+    )
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """
         Detect Open Graph meta tags with confidence scoring.
 
         Returns:
             Confidence score 0-100. Threshold for detection is 40.
         """
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Count Open Graph meta tags
@@ -37,15 +54,15 @@ class OpenGraphProfile(FrameworkProfile):
             score += 25  # Few OG tags = low confidence
 
         # Check for common Open Graph tags
-        if 'property="og:title"' in html:
+        if 'property="og:title"' in found:
             score += 15
-        if 'property="og:description"' in html:
+        if 'property="og:description"' in found:
             score += 10
-        if 'property="og:image"' in html:
+        if 'property="og:image"' in found:
             score += 10
-        if 'property="og:url"' in html:
+        if 'property="og:url"' in found:
             score += 10
-        if 'property="og:type"' in html:
+        if 'property="og:type"' in found:
             score += 5
 
         return score
@@ -139,7 +156,8 @@ class OpenGraphProfile(FrameworkProfile):
             >>> print(metadata)
             {'title': 'Article Title', 'description': '...', 'image': 'https://...'}
         """
-        soup = BeautifulSoup(html, "html.parser")
+        # Only <meta> elements are needed, so skip building the rest of the tree
+        soup = parse_html(html, parse_only=SoupStrainer("meta"))
         metadata: dict[str, str] = {}
 
         # Find all OG meta tags
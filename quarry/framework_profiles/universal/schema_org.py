@@ -1,11 +1,16 @@
 """Schema.org microdata and JSON-LD profile for structured data extraction."""
 
 import json
-from typing import Any
+from typing import Any, ClassVar
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import SoupStrainer, Tag
 
-from quarry.framework_profiles.base import FrameworkProfile
+from quarry.framework_profiles.base import FrameworkProfile, scan_markers
+from quarry.lib.bs4_utils import parse_html
+
+# Only JSON-LD script elements are built when extracting structured data
+_JSON_LD_TYPE = "application/ld+json"
+_JSON_LD_STRAINER = SoupStrainer("script", type=_JSON_LD_TYPE)
 
 
 class SchemaOrgProfile(FrameworkProfile):
@@ -22,6 +27,25 @@ class SchemaOrgProfile(FrameworkProfile):
 
     name = "schema_org"
 
+    # Common Schema.org types and the confidence each adds when present
+    _SCHEMA_TYPES: ClassVar[tuple[tuple[str, int], ...]] = (
+        ("Article", 15),
+        ("Product", 15),
+        ("NewsArticle", 12),
+        ("BlogPosting", 12),
+        ("Recipe", 10),
+        ("Event", 10),
+        ("Person", 10),
+        ("Organization", 10),
+    )
+    markers = (
+        "itemscope",
+        "itemprop=",
+        "itemtype=",
+        *(f"schema.org/{schema_type}" for schema_type, _ in _SCHEMA_TYPES),
+        *(f'"@type":"{schema_type}"' for schema_type, _ in _SCHEMA_TYPES),
+    )
+
     @classmethod
     def _extract_json_ld(cls, html: str) -> list[dict[str, Any]]:
         """
@@ -30,8 +54,12 @@ class SchemaOrgProfile(FrameworkProfile):
         Returns:
             List of parsed JSON-LD objects (may be empty)
         """
-        soup = BeautifulSoup(html, "html.parser")
-        json_ld_scripts = soup.find_all("script", type="application/ld+json")
+        # detect() runs on every page; most have no JSON-LD, so skip the parse
+        if _JSON_LD_TYPE not in html:
+            return []
+
+        soup = parse_html(html, parse_only=_JSON_LD_STRAINER)
+        json_ld_scripts = soup.find_all("script", type=_JSON_LD_TYPE)
 
         parsed_objects = []
         for script in json_ld_scripts:
@@ -52,13 +80,23 @@ class SchemaOrgProfile(FrameworkProfile):
         return parsed_objects
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """
         Detect Schema.org structured data with confidence scoring.
 
         Returns:
             Confidence score 0-100. Threshold for detection is 40.
         """
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # JSON-LD structured data (modern, preferred format)
@@ -70,27 +108,16 @@ class SchemaOrgProfile(FrameworkProfile):
                 score += min(20, len(json_ld_blocks) * 5)
 
         # Microdata attributes (legacy format, still supported)
-        if "itemscope" in html:
+        if "itemscope" in found:
             score += 30  # Secondary indicator
-        if "itemprop=" in html:
+        if "itemprop=" in found:
             score += 25  # Property definitions
-        if "itemtype=" in html:
+        if "itemtype=" in found:
             score += 20  # Type definitions
 
         # Common Schema.org types (add confidence if present)
-        schema_types = [
-            ("Article", 15),
-            ("Product", 15),
-            ("NewsArticle", 12),
-            ("BlogPosting", 12),
-            ("Recipe", 10),
-            ("Event", 10),
-            ("Person", 10),
-            ("Organization", 10),
-        ]
-
-        for schema_type, type_score in schema_types:
-            if f"schema.org/{schema_type}" in html or f'"@type":"{schema_type}"' in html:
+        for schema_type, type_score in cls._SCHEMA_TYPES:
+            if f"schema.org/{schema_type}" in found or f'"@type":"{schema_type}"' in found:
                 score += type_score
                 break  # Only add bonus once
 
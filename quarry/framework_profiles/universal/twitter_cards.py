@@ -1,9 +1,9 @@
 """Twitter Cards meta tag profile for social media metadata extraction."""
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import SoupStrainer, Tag
 
-from quarry.framework_profiles.base import FrameworkProfile
-from quarry.lib.bs4_utils import attr_str
+from quarry.framework_profiles.base import FrameworkProfile, scan_markers
+from quarry.lib.bs4_utils import attr_str, parse_html
 
 
 class TwitterCardsProfile(FrameworkProfile):
@@ -16,15 +16,33 @@ class TwitterCardsProfile(FrameworkProfile):
     """
 
     name = "twitter_cards"
+    markers = (
+        'name="twitter:card"',
+        'name="twitter:title"',
+        'name="twitter:description"',
+        'name="twitter:image"',
+        'name="twitter:site"',
+        'name="twitter:creator"',
+    )
 
     @classmethod
-    def detect(cls, html: str, item_element: Tag | None = None) -> int:
+    def detect(
+        cls,
+        html: str,
+        item_element: Tag | None = None,
+        *,
+        found: frozenset[str] | None = None,
+        item_classes: frozenset[str] | None = None,
+        folded: bytes | None = None,
+    ) -> int:
         """
         Detect Twitter Cards meta tags with confidence scoring.
 
         Returns:
             Confidence score 0-100. Threshold for detection is 40.
         """
+        if found is None:
+            found = scan_markers(html, cls.markers)
         score = 0
 
         # Count Twitter Card meta tags
@@ -37,15 +55,15 @@ class TwitterCardsProfile(FrameworkProfile):
             score += 25  # Few Twitter tags = low confidence
 
         # Check for common Twitter Card tags
-        if 'name="twitter:card"' in html:
+        if 'name="twitter:card"' in found:
             score += 20  # Card type is required
-        if 'name="twitter:title"' in html:
+        if 'name="twitter:title"' in found:
             score += 15
-        if 'name="twitter:description"' in html:
+        if 'name="twitter:description"' in found:
             score += 10
-        if 'name="twitter:image"' in html:
+        if 'name="twitter:image"' in found:
             score += 10
-        if 'name="twitter:site"' in html or 'name="twitter:creator"' in html:
+        if 'name="twitter:site"' in found or 'name="twitter:creator"' in found:
             score += 10
 
         return score
@@ -129,7 +147,8 @@ class TwitterCardsProfile(FrameworkProfile):
             >>> print(metadata)
             {'title': 'Article Title', 'description': '...', 'image': 'https://...'}
         """
-        soup = BeautifulSoup(html, "html.parser")
+        # Only <meta> elements are needed, so skip building the rest of the tree
+        soup = parse_html(html, parse_only=SoupStrainer("meta"))
         metadata: dict[str, str] = {}
 
         # Find all Twitter Card meta tags (name attribute)
@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Iterable
 from typing import Any
 
 from bs4 import BeautifulSoup, Tag
 
 from quarry.framework_profiles import (
+    build_item_tree,
     detect_framework,
     get_framework_field_selector,
     is_framework_pattern,
 )
-from quarry.lib.bs4_utils import attr_str
+from quarry.lib.bs4_utils import (
+    attr_str,
+    compile_selector,
+    parse_html,
+    select_list,
+    text_prefix,
+)
 from quarry.tools.scout.analyzer import _suggest_fields, analyze_page
 
 
@@ -25,8 +33,11 @@ def _class_tokens(tag: Tag) -> list[str]:
     return [c for c in raw if isinstance(c, str)]
 
 
-def inspect_html(html: str) -> dict[str, Any]:
-    """Return high-level metadata for legacy callers."""
+def inspect_html(html: str, *, soup: BeautifulSoup | None = None) -> dict[str, Any]:
+    """Return high-level metadata for legacy callers.
+
+    ``soup`` may be passed to reuse a parse of ``html`` the caller already has.
+    """
 
     if not html or not html.strip():
         return {
@@ -37,17 +48,26 @@ def inspect_html(html: str) -> dict[str, Any]:
             "sample_links": [],
         }
 
-    analysis = analyze_page(html)
-    soup = BeautifulSoup(html, "html.parser")
+    # One parse shared with the Scout analysis
+    if soup is None:
+        soup = parse_html(html)
+    analysis = analyze_page(html, soup=soup)
 
     metadata = analysis.get("metadata", {})
 
+    # One walk gathers class counts, class samples and link stats
     class_counter: Counter[str] = Counter()
     samples: dict[str, Tag] = {}
+    total_links = 0
+    links: list[Tag] = []  # only the first few are sampled
     for tag in soup.find_all(True):
         for cls in _class_tokens(tag):
             class_counter[cls] += 1
             samples.setdefault(cls, tag)
+        if tag.name == "a" and tag.has_attr("href"):
+            total_links += 1
+            if len(links) < 10:
+                links.append(tag)
 
     repeated_classes: list[dict[str, Any]] = []
     for cls, count in class_counter.most_common(20):
@@ -59,12 +79,12 @@ def inspect_html(html: str) -> dict[str, Any]:
                 "class": cls,
                 "count": count,
                 "tag": sample.name if sample else None,
-                "sample_text": (sample.get_text(strip=True)[:100] if sample else ""),
+                "sample_text": (text_prefix(sample, 100) if sample else ""),
             }
         )
 
     sample_links = []
-    for link in soup.find_all("a", href=True)[:10]:
+    for link in links:
         sample_links.append(
             {
                 "href": link.get("href") or "",
@@ -76,21 +96,28 @@ def inspect_html(html: str) -> dict[str, Any]:
     return {
         "title": metadata.get("title", ""),
         "description": metadata.get("description", ""),
-        "total_links": len(soup.find_all("a", href=True)),
+        "total_links": total_links,
         "repeated_classes": repeated_classes,
         "sample_links": sample_links,
         "containers": analysis.get("containers", []),
     }
 
 
-def find_item_selector(html: str, min_items: int = 3) -> list[dict[str, Any]]:
-    """Approximate the legacy selector suggestions using Scout containers."""
+def find_item_selector(
+    html: str, min_items: int = 3, *, soup: BeautifulSoup | None = None
+) -> list[dict[str, Any]]:
+    """Approximate the legacy selector suggestions using Scout containers.
+
+    ``soup`` may be passed to reuse a parse of ``html`` the caller already has.
+    """
 
     if not html or not html.strip():
         return []
 
-    analysis = analyze_page(html)
-    soup = BeautifulSoup(html, "html.parser")
+    # One parse shared with the Scout analysis
+    if soup is None:
+        soup = parse_html(html)
+    analysis = analyze_page(html, soup=soup)
 
     containers = analysis.get("containers") or []
     detected_framework = detect_framework(html)
@@ -129,9 +156,9 @@ def find_item_selector(html: str, min_items: int = 3) -> list[dict[str, Any]]:
             if link:
                 sample_url = attr_str(link, "href")
                 if not sample_text:
-                    sample_text = link.get_text(strip=True)
+                    sample_text = text_prefix(link, 120)
             if not sample_text:
-                sample_text = element.get_text(strip=True)
+                sample_text = text_prefix(element, 120)
 
         framework_match = False
         if detected_framework:
@@ -154,31 +181,61 @@ def find_item_selector(html: str, min_items: int = 3) -> list[dict[str, Any]]:
 def generate_field_selector(item_element: Tag, field_type: str) -> str | None:
     """Suggest a field selector for ``item_element``."""
 
+    return generate_field_selectors(item_element, [field_type])[field_type]
+
+
+def generate_field_selectors(
+    item_element: Tag, field_types: Iterable[str]
+) -> dict[str, str | None]:
+    """Suggest selectors for several fields of ``item_element`` at once.
+
+    Framework detection and field analysis run once for the item, rather than
+    once per field as with repeated ``generate_field_selector`` calls.
+    """
+
     if not isinstance(item_element, Tag):
-        return None
+        return dict.fromkeys(field_types)
 
     framework = detect_framework(str(item_element.parent or item_element), item_element)
-    if framework:
-        selector = get_framework_field_selector(framework, item_element, field_type)
-        if isinstance(selector, str) and selector:
-            return selector
+    # One lxml mirror of the item serves every field's pattern checks
+    tree = build_item_tree(item_element) if framework else None
+    candidates: list[dict[str, Any]] | None = None
+
+    selectors: dict[str, str | None] = {}
+    for field_type in field_types:
+        if framework:
+            selector = get_framework_field_selector(framework, item_element, field_type, tree)
+            if isinstance(selector, str) and selector:
+                selectors[field_type] = selector
+                continue
+        if candidates is None:
+            candidates = _suggest_fields(item_element)
+        selectors[field_type] = _match_field(item_element, field_type, candidates)
 
-    normalized_field = field_type.lower()
-    candidates = _suggest_fields(item_element)
+    return selectors
 
-    def _format(candidate: dict[str, Any]) -> str | None:
-        selector_val = candidate.get("selector")
-        if not isinstance(selector_val, str) or not selector_val:
-            return None
-        attribute_val = candidate.get("attribute")
-        if isinstance(attribute_val, str) and "::attr" not in selector_val:
-            return f"{selector_val}::attr({attribute_val})"
-        return selector_val
+
+def _format_candidate(candidate: dict[str, Any]) -> str | None:
+    selector_val = candidate.get("selector")
+    if not isinstance(selector_val, str) or not selector_val:
+        return None
+    attribute_val = candidate.get("attribute")
+    if isinstance(attribute_val, str) and "::attr" not in selector_val:
+        return f"{selector_val}::attr({attribute_val})"
+    return selector_val
+
+
+def _match_field(
+    item_element: Tag, field_type: str, candidates: list[dict[str, Any]]
+) -> str | None:
+    """Pick a selector for one field from the item's suggested fields."""
+
+    normalized_field = field_type.lower()
 
     for candidate in candidates:
         name = (candidate.get("name") or "").lower()
         if name == normalized_field:
-            formatted = _format(candidate)
+            formatted = _format_candidate(candidate)
             if formatted:
                 return formatted
 
@@ -193,7 +250,7 @@ def generate_field_selector(item_element: Tag, field_type: str) -> str | None:
         name = (candidate.get("name") or "").lower()
         for target, variants in aliases.items():
             if normalized_field == target and name in variants:
-                formatted = _format(candidate)
+                formatted = _format_candidate(candidate)
                 if formatted:
                     return formatted
 
@@ -228,19 +285,18 @@ def preview_extraction(
     item_selector: str,
     field_selectors: dict[str, str],
     limit: int = 3,
+    *,
+    soup: BeautifulSoup | None = None,
 ) -> list[dict[str, Any]]:
-    """Preview extracted records for a selector map (legacy helper)."""
+    """Preview extracted records for a selector map (legacy helper).
 
-    if not html or not html.strip() or not item_selector or not item_selector.strip():
-        return []
-
-    soup = BeautifulSoup(html, "html.parser")
+    ``soup`` may be passed to reuse a parse of ``html`` the caller already has.
+    """
 
-    try:
-        items = soup.select(item_selector)
-    except Exception:
+    if not html or not html.strip() or not item_selector or not item_selector.strip():
         return []
 
+    items = select_list(soup if soup is not None else parse_html(html), item_selector)
     if not items:
         return []
 
@@ -258,10 +314,10 @@ def preview_extraction(
                 if "::attr(" in selector:
                     css, attr_part = selector.split("::attr(", 1)
                     attr = attr_part.rstrip(")")
-                    target = item if not css else item.select_one(css)
+                    target = item if not css else compile_selector(css).select_one(item)
                     record[field_name] = target.get(attr, "") if target else ""
                 else:
-                    target = item.select_one(selector)
+                    target = compile_selector(selector).select_one(item)
                     record[field_name] = target.get_text(strip=True) if target else ""
             except Exception:
                 record[field_name] = "[extraction failed]"
@@ -273,6 +329,7 @@ def preview_extraction(
 __all__ = [
     "find_item_selector",
     "generate_field_selector",
+    "generate_field_selectors",
     "inspect_html",
     "preview_extraction",
 ]
@@ -1,6 +1,23 @@
 from __future__ import annotations
 
-from bs4 import BeautifulSoup, ResultSet, Tag
+from functools import lru_cache
+
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+# Prefer the C-backed lxml tree builder; html.parser is pure Python and
+# dominates CPU on large pages. Fall back when lxml isn't installed.
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - depends on environment
+    HTML_PARSER = "html.parser"
+
+
+def parse_html(html: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    # parse_only builds just the matching elements, for callers that need a few tags
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
 
 
 def class_tokens(tag: Tag) -> list[str]:
@@ -17,12 +34,28 @@ def attr_str(tag: Tag, name: str) -> str:
     return value if isinstance(value, str) else ""
 
 
-def select_list(node: BeautifulSoup | Tag, selector: str) -> list[Tag]:
+def text_prefix(tag: Tag, limit: int) -> str:
+    # Same as tag.get_text(strip=True)[:limit], but stops reading strings once
+    # the prefix is complete instead of joining the text of the whole subtree
+    parts: list[str] = []
+    size = 0
+    for text in tag.stripped_strings:
+        parts.append(text)
+        size += len(text)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> sv.SoupSieve:
+    # Tag.select() re-resolves the selector through soupsieve on every call;
+    # field selectors run once per item, so compile each string once
+    return sv.compile(selector)
+
+
+def select_list(node: BeautifulSoup | Tag, selector: str, limit: int = 0) -> list[Tag]:
     try:
-        result = node.select(selector)
+        return list(compile_selector(selector).select(node, limit=limit))
     except Exception:
         return []
-    if isinstance(result, ResultSet):
-        # Convert ResultSet[Tag] to list[Tag]
-        return list(result)
-    return list(result)
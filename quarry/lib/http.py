@@ -13,7 +13,10 @@ import logging
 import os
 import random
 import sys
+import threading
 import time
+import weakref
+from http.cookiejar import DefaultCookiePolicy
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
@@ -26,6 +29,11 @@ _RATE_LIMITER_CONTAINER: dict[str, DomainRateLimiter | None] = {"instance": None
 
 _LOG = logging.getLogger(__name__)
 
+# Default session per thread, so calls without an explicit session still reuse
+# pooled TCP/TLS connections (requests.Session is not guaranteed thread-safe).
+# It only pools connections: it keeps no cookies and no per-call proxy settings.
+_SESSION_LOCAL = threading.local()
+
 # Cache for robots.txt parsers (domain -> RobotFileParser | None)
 # None indicates robots.txt fetch failed, assume allowed
 _ROBOTS_CACHE: dict[str, RobotFileParser | None] = {}
@@ -80,6 +88,19 @@ def get_rate_limiter() -> DomainRateLimiter:
     return limiter
 
 
+def _default_session() -> requests.Session:
+    """Get or create this thread's shared session for get_html."""
+    session: requests.Session | None = getattr(_SESSION_LOCAL, "session", None)
+    if session is None:
+        session = requests.Session()
+        # Reject all cookies so state never leaks between hosts or jobs
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        # Close the pooled connections once the owning thread is gone
+        weakref.finalize(threading.current_thread(), session.close)
+        _SESSION_LOCAL.session = session
+    return session
+
+
 def _check_robots_txt(url: str, user_agent: str) -> bool:
     """
     Check if URL is allowed by robots.txt.
@@ -231,6 +252,7 @@ def get_html(
         max_retries: Max retry attempts
         respect_robots: Check robots.txt before fetching
         session: Reuse requests.Session for cookie persistence
+            (None = a per-thread, cookie-less session that only pools connections)
 
     Returns:
         HTML content as string
@@ -281,12 +303,12 @@ def get_html(
     # Build realistic browser headers
     headers = _build_browser_headers(url, user_agent=ua)
 
-    # Use provided session or create new one
-    http_client = session or requests.Session()
-    # Optional proxy override via PROXY_URL (requests also honors *_PROXY)
+    # Use provided session or this thread's pooled default
+    http_client = session or _default_session()
+    # Optional proxy override via PROXY_URL (requests also honors *_PROXY);
+    # passed per request so no session is left pointing at the proxy
     proxy_url = os.environ.get("PROXY_URL")
-    if proxy_url:
-        http_client.proxies.update({"http": proxy_url, "https": proxy_url})
+    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
 
     limiter = get_rate_limiter()
 
@@ -301,7 +323,7 @@ def get_html(
             time.sleep(random.uniform(0, 0.2))
 
         try:
-            response = http_client.get(url, headers=headers, timeout=timeout)
+            response = http_client.get(url, headers=headers, timeout=timeout, proxies=proxies)
             response.raise_for_status()
 
             # Optional content size guard
@@ -23,7 +23,7 @@ class TokenBucket:
         self.rate = rate
         self.capacity = capacity
         self.tokens = float(capacity)
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self.lock = threading.Lock()
 
     def consume(self, tokens: int = 1) -> float:
@@ -34,7 +34,7 @@ class TokenBucket:
             Time waited in seconds (0 if no wait needed)
         """
         with self.lock:
-            now = time.time()
+            now = time.monotonic()
             elapsed = now - self.last_update
 
             # Refill tokens based on elapsed time
@@ -55,7 +55,7 @@ class TokenBucket:
 
             # After sleeping, update state
             self.tokens = 0.0
-            self.last_update = time.time()
+            self.last_update = time.monotonic()
 
             return wait_time
 
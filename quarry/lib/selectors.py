@@ -13,10 +13,14 @@ from typing import Any
 
 from bs4 import BeautifulSoup, Tag
 
-from quarry.lib.bs4_utils import class_tokens
+from quarry.lib.bs4_utils import class_tokens, compile_selector, text_prefix
 
 MIN_DYNAMIC_NAME_LEN = 3
 
+_HEX_SEGMENT_RE = re.compile(r'[0-9a-f]{6,}')
+_UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+_LONG_NUMERIC_SUFFIX_RE = re.compile(r'-?\d{8,}$')
+
 
 class SelectorChain:
     """
@@ -44,7 +48,7 @@ class SelectorChain:
         """Try selectors in order until one matches."""
         for selector in self.selectors:
             try:
-                result = element.select_one(selector)
+                result = compile_selector(selector).select_one(element)
                 if result:
                     return result
             except Exception:
@@ -55,7 +59,7 @@ class SelectorChain:
         """Try selectors in order until one finds elements."""
         for selector in self.selectors:
             try:
-                results = element.select(selector)
+                results = compile_selector(selector).select(element)
                 if results:
                     return results
             except Exception:
@@ -230,16 +234,15 @@ def _looks_dynamic(name: str) -> bool:
         return True
 
     # Count hex-like segments (common in hashes)
-    hex_segments = re.findall(r'[0-9a-f]{6,}', name.lower())
-    if hex_segments:
+    if _HEX_SEGMENT_RE.search(name.lower()):
         return True
 
     # UUID pattern
-    if re.match(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', name.lower()):
+    if _UUID_RE.match(name.lower()):
         return True
 
     # Long numeric suffixes often dynamic
-    if re.search(r'-?\d{8,}$', name):
+    if _LONG_NUMERIC_SUFFIX_RE.search(name):
         return True
 
     return False
@@ -346,7 +349,7 @@ def validate_selector(
         # Get sample texts
         sample_texts = []
         for elem in elements[:3]:
-            text = elem.get_text(strip=True)[:100]
+            text = text_prefix(elem, 100)
             if text:
                 sample_texts.append(text)
 
@@ -0,0 +1,83 @@
+"""JSON (de)serialization for records, using orjson when it is installed."""
+
+import json
+import math
+import re
+from collections.abc import Callable
+from typing import Any
+
+# Optional Rust extension: several times faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+# Hand datetimes and dataclasses to default, as the stdlib encoder does
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+# orjson output that may hold a NaN/Infinity written as null, or a float the
+# stdlib would write in exponent form (1e+20, 2.5e-05)
+_FLOAT_HINT = re.compile(rb"null|[0-9]e|0\.0000")
+
+
+def _has_stdlib_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj) or "e" in repr(obj)
+    if isinstance(obj, dict):
+        return any(_has_stdlib_float(value) for value in obj.values())
+    if isinstance(obj, list | tuple):
+        return any(_has_stdlib_float(value) for value in obj)
+    return False
+
+
+def dumps(obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> str:
+    """
+    Serialize obj to a compact JSON string, keeping non-ASCII characters as-is.
+
+    orjson and the stdlib encoder produce the same text for JSON types, and
+    both hand datetimes and dataclasses to default. Values orjson rejects or
+    writes differently (integers wider than 64 bits, NaN/Infinity, floats the
+    stdlib puts in exponent form) go through the stdlib encoder. orjson still
+    encodes UUIDs and enums itself. Strings with lone surrogates are written
+    with ASCII escapes so the text can always be encoded as UTF-8.
+    """
+    if orjson is not None:
+        option = _ORJSON_OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            encoded = orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            pass
+        else:
+            # Only pay for the walk when the output hints at such a float
+            if _FLOAT_HINT.search(encoded) is None or not _has_stdlib_float(obj):
+                return encoded.decode("utf-8")
+    text = json.dumps(
+        obj, sort_keys=sort_keys, default=default, ensure_ascii=False, separators=(",", ":")
+    )
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates can't be stored or hashed as UTF-8; escape them
+        return json.dumps(obj, sort_keys=sort_keys, default=default, separators=(",", ":"))
+    return text
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises json.JSONDecodeError on invalid input, as the stdlib does.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The stdlib also accepts NaN/Infinity literals; let it decide
+            pass
+    return json.loads(data)
@@ -9,6 +9,9 @@ import pyarrow.parquet as pq
 
 from quarry.transforms.base import Frame
 
+# Rows per record batch / row group when writing
+_BATCH_ROWS = 10_000
+
 
 class ParquetSink:
     """Parquet file sink with timezone-aware timestamp paths."""
@@ -37,8 +40,12 @@ class ParquetSink:
         output_path = Path(path_str)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write Parquet
-        table = pa.Table.from_pandas(df)
-        pq.write_table(table, output_path)
+        # Write Parquet one row group at a time, so only a batch-sized Arrow
+        # copy of the frame is held in memory alongside the DataFrame
+        schema = pa.Schema.from_pandas(df)
+        with pq.ParquetWriter(output_path, schema) as writer:
+            for start in range(0, len(df), _BATCH_ROWS):
+                chunk = df.iloc[start : start + _BATCH_ROWS]
+                writer.write_batch(pa.RecordBatch.from_pandas(chunk, schema=schema))
 
         return str(output_path)
@@ -1,11 +1,12 @@
 """SQLite state management for jobs and items."""
 
-import json
 import sqlite3
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from quarry.lib import serialization
+
 _DEFAULT_DB_PATH = "data/cache/state.sqlite"
 
 
@@ -89,47 +90,34 @@ def upsert_items(job: str, records: list[dict[str, Any]], db_path: str | None =
     Returns:
         Count of newly inserted rows (0 if all were updates).
     """
+    # Collapse repeated ids in memory first; the last occurrence wins, as with row-by-row updates
+    payloads: dict[str, str] = {}
+    for record in records:
+        item_id = str(record.get("id", ""))
+        if item_id:
+            payloads[item_id] = serialization.dumps(record)
+
     conn = open_db(db_path)
     now = datetime.now(UTC).isoformat()
-    new_count = 0
 
-    for record in records:
-        item_id = str(record.get("id", ""))
-        if not item_id:
-            continue
-
-        payload_json = json.dumps(record)
-
-        # Check if exists
-        existing = conn.execute(
-            "SELECT first_seen FROM items WHERE job = ? AND id = ?",
-            (job, item_id),
-        ).fetchone()
-
-        if existing:
-            # Update
-            conn.execute(
-                """
-                UPDATE items
-                SET payload_json = ?, last_seen = ?
-                WHERE job = ? AND id = ?
-            """,
-                (payload_json, now, job, item_id),
-            )
-        else:
-            # Insert
-            new_count += 1
-            conn.execute(
-                """
-                INSERT INTO items (job, id, payload_json, first_seen, last_seen)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (job, item_id, payload_json, now, now),
-            )
+    # One batched upsert instead of a SELECT plus INSERT/UPDATE round trip per record
+    count_sql = "SELECT COUNT(*) FROM items WHERE job = ?"
+    before = conn.execute(count_sql, (job,)).fetchone()[0]
+    conn.executemany(
+        """
+        INSERT INTO items (job, id, payload_json, first_seen, last_seen)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(job, id) DO UPDATE SET
+            payload_json = excluded.payload_json,
+            last_seen = excluded.last_seen
+    """,
+        [(job, item_id, payload_json, now, now) for item_id, payload_json in payloads.items()],
+    )
+    new_count = conn.execute(count_sql, (job,)).fetchone()[0] - before
 
     conn.commit()
     conn.close()
-    return new_count
+    return int(new_count)
 
 
 def record_failed_url(job: str, url: str, error_message: str, db_path: str | None = None) -> None:
@@ -1,6 +1,5 @@
 """Executor for running extraction at scale."""
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -8,6 +7,7 @@ from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+from quarry.lib import serialization
 from quarry.lib.bs4_utils import attr_str
 from quarry.lib.http import get_html
 from quarry.lib.schemas import ExtractionSchema, load_schema
@@ -217,7 +217,7 @@ def write_jsonl(items: list[dict[str, Any]], output_path: str | Path) -> int:
     count = 0
     with output_path.open("w", encoding="utf-8") as f:
         for item in items:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            f.write(serialization.dumps(item) + "\n")
             count += 1
 
     return count
@@ -240,7 +240,7 @@ def append_jsonl(items: list[dict[str, Any]], output_path: str | Path) -> int:
     count = 0
     with output_path.open("a", encoding="utf-8") as f:
         for item in items:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            f.write(serialization.dumps(item) + "\n")
             count += 1
 
     return count
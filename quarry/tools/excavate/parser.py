@@ -105,7 +105,7 @@ class SchemaParser:
             if field_schema.multiple:
                 elements = select_list(item_element, field_schema.selector)
             else:
-                elements = select_list(item_element, field_schema.selector)[:1]
+                elements = select_list(item_element, field_schema.selector, limit=1)
 
             if not elements:
                 # No match found
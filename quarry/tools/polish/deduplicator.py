@@ -1,9 +1,10 @@
 """Deduplication engine for Polish tool."""
 
 import hashlib
-import json
 from typing import Any, Literal
 
+from quarry.lib import serialization
+
 
 class Deduplicator:
     """
@@ -53,7 +54,7 @@ class Deduplicator:
             key_data = {k: v for k, v in record.items() if k != "_meta"}
 
         # Create stable JSON representation
-        json_str = json.dumps(key_data, sort_keys=True, default=str)
+        json_str = serialization.dumps(key_data, sort_keys=True, default=str)
         return hashlib.sha256(json_str.encode()).hexdigest()
 
     def is_duplicate(self, record: dict[str, Any]) -> bool:
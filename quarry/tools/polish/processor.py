@@ -5,6 +5,8 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Literal
 
+from quarry.lib import serialization
+
 from .deduplicator import Deduplicator
 from .transformers import apply_transformation
 from .validators import validate_record
@@ -78,7 +80,7 @@ class PolishProcessor:
                     continue
 
                 try:
-                    record = json.loads(line)
+                    record = serialization.loads(line)
                     self.stats["records_read"] += 1
 
                     # Apply transformations
@@ -125,7 +127,7 @@ class PolishProcessor:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with output_path.open("w", encoding="utf-8") as f:
             for record in records_to_write:
-                f.write(json.dumps(record) + "\n")
+                f.write(serialization.dumps(record) + "\n")
                 self.stats["records_written"] += 1
 
         return self.stats
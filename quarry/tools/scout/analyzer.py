@@ -6,9 +6,26 @@ from typing import Any, cast
 
 from bs4 import BeautifulSoup, Tag
 
-from quarry.framework_profiles import _get_element_classes, detect_all_frameworks
+from quarry.framework_profiles import (
+    _get_element_classes,
+    contains_any_marker,
+    detect_all_frameworks,
+)
+from quarry.lib.bs4_utils import parse_html, text_prefix
 from quarry.lib.selectors import build_robust_selector, simplify_selector
 
+# Patterns used per candidate selector/link, compiled once at import
+_NTH_OF_TYPE_RE = re.compile(r":nth-of-type\(\d+\)")
+_YEAR_ID_RE = re.compile(r"#[^\s>]*?(?:19|20)\d{2}[^\s>]*")
+_YEAR_CLASS_RE = re.compile(r"\.[^\s>]*?(?:19|20)\d{2}[^\s>]*")
+_CHILD_COMBINATOR_RE = re.compile(r"\s*\>\s*")
+_WHITESPACE_RE = re.compile(r"\s+")
+_LEADING_COMBINATOR_RE = re.compile(r"^(>\s*)+")
+_LONG_DIGIT_RUN_RE = re.compile(r"\d{4,}")
+_NUMERIC_SUFFIX_RE = re.compile(r"\d{3,}$")
+_NEXT_TEXT_RE = re.compile(r"\b(next|older|more|weiter|nächste|suivant)\b", re.I)
+_NEXT_ARROW_RE = re.compile(r"[»\u203A→⟩⟫]")
+
 
 # Module-level helpers to normalize BeautifulSoup attributes
 def _class_tokens(tag: Tag) -> list[str]:
@@ -25,13 +42,16 @@ def _attr_str(tag: Tag, name: str) -> str:
     return value if isinstance(value, str) else ""
 
 
-def analyze_page(html: str, url: str | None = None) -> dict[str, Any]:
+def analyze_page(
+    html: str, url: str | None = None, *, soup: BeautifulSoup | None = None
+) -> dict[str, Any]:
     """
     Analyze a web page and return comprehensive structural analysis.
 
     Args:
         html: HTML content to analyze
         url: Optional URL for context
+        soup: Parsed ``html``, when the caller already has one (not modified)
 
     Returns:
         Dictionary with analysis results:
@@ -54,10 +74,11 @@ def analyze_page(html: str, url: str | None = None) -> dict[str, Any]:
             "suggestions": {},
         }
 
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = parse_html(html)
 
-    # Detect frameworks
-    frameworks = _detect_all_frameworks(html)
+    # Detect frameworks (reuses the page parse above)
+    frameworks = _detect_all_frameworks(html, soup)
 
     # Find containers (repeated item patterns)
     containers = _find_containers(soup)
@@ -81,12 +102,15 @@ def analyze_page(html: str, url: str | None = None) -> dict[str, Any]:
     }
 
 
-def _detect_all_frameworks(html: str) -> list[dict[str, Any]]:
-    """Detect all frameworks in the HTML."""
+def _detect_all_frameworks(html: str, soup: BeautifulSoup | None = None) -> list[dict[str, Any]]:
+    """Detect all frameworks in the HTML.
+
+    Pass ``soup`` when the caller has already parsed ``html`` to avoid a second parse.
+    """
     frameworks = []
 
-    # Parse HTML once for framework detection
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = parse_html(html)
 
     # Use existing framework detection
     body = soup.find("body") or soup
@@ -122,51 +146,67 @@ def _detect_all_frameworks(html: str) -> list[dict[str, Any]]:
     return frameworks
 
 
+# Blacklist of common boilerplate selectors/classes that should be deprioritized
+_BOILERPLATE_PATTERNS = (
+    'header',
+    'footer',
+    'nav',
+    'menu',
+    'sidebar',
+    'breadcrumb',
+    'cookie',
+    'banner',
+    'ad',
+    'advertisement',
+    'social',
+    'share',
+    'toolbar',
+    'utility',
+    'meta',
+    'promo',
+    'related',
+    'widget',
+    'plugin',
+    'tracking',
+)
+
+# Prioritize content containers
+_CONTENT_PATTERNS = (
+    'article',
+    'post',
+    'story',
+    'item',
+    'card',
+    'entry',
+    'product',
+    'result',
+    'listing',
+    'content',
+    'main',
+    'feed',
+    'list',
+)
+
+
+# Elements considered as item containers, in the order they are examined
+_CONTAINER_TAGS = (
+    "body",
+    "div",
+    "section",
+    "article",
+    "ul",
+    "ol",
+    "main",
+    "aside",
+    "table",
+    "tbody",
+)
+
+
 def _find_containers(soup: BeautifulSoup) -> list[dict[str, Any]]:
     """Find container elements with repeated children (likely item lists)."""
     containers = []
 
-    # Blacklist of common boilerplate selectors/classes that should be deprioritized
-    BOILERPLATE_PATTERNS = [
-        'header',
-        'footer',
-        'nav',
-        'menu',
-        'sidebar',
-        'breadcrumb',
-        'cookie',
-        'banner',
-        'ad',
-        'advertisement',
-        'social',
-        'share',
-        'toolbar',
-        'utility',
-        'meta',
-        'promo',
-        'related',
-        'widget',
-        'plugin',
-        'tracking',
-    ]
-
-    # Prioritize content containers
-    CONTENT_PATTERNS = [
-        'article',
-        'post',
-        'story',
-        'item',
-        'card',
-        'entry',
-        'product',
-        'result',
-        'listing',
-        'content',
-        'main',
-        'feed',
-        'list',
-    ]
-
     # --- Safe attribute helpers moved to module scope ---
 
     def is_boilerplate(element: Tag) -> bool:
@@ -175,7 +215,7 @@ def _find_containers(soup: BeautifulSoup) -> list[dict[str, Any]]:
         elem_id = _attr_str(element, "id").lower()
         combined = f"{classes} {elem_id}"
 
-        return any(pattern in combined for pattern in BOILERPLATE_PATTERNS)
+        return contains_any_marker(combined, _BOILERPLATE_PATTERNS)
 
     def is_content_container(element: Tag) -> bool:
         """Check if element is likely a content container."""
@@ -183,7 +223,7 @@ def _find_containers(soup: BeautifulSoup) -> list[dict[str, Any]]:
         elem_id = _attr_str(element, "id").lower()
         combined = f"{classes} {elem_id}"
 
-        return any(pattern in combined for pattern in CONTENT_PATTERNS)
+        return contains_any_marker(combined, _CONTENT_PATTERNS)
 
     def has_meaningful_content(element: Tag) -> bool:
         """Heuristic: consider content meaningful if it has readable text or links."""
@@ -197,19 +237,13 @@ def _find_containers(soup: BeautifulSoup) -> list[dict[str, Any]]:
             return True
         return False
 
-    for container_tag in [
-        "body",
-        "div",
-        "section",
-        "article",
-        "ul",
-        "ol",
-        "main",
-        "aside",
-        "table",
-        "tbody",
-    ]:
-        for container in soup.find_all(container_tag):
+    # One tree walk collects every candidate, grouped so tags are still visited in this order
+    candidates_by_tag: dict[str, list[Tag]] = {tag_name: [] for tag_name in _CONTAINER_TAGS}
+    for element in soup.find_all(_CONTAINER_TAGS):
+        candidates_by_tag[element.name].append(element)
+
+    for container_tag in _CONTAINER_TAGS:
+        for container in candidates_by_tag[container_tag]:
             # Skip obvious boilerplate
             if is_boilerplate(container):
                 continue
@@ -278,7 +312,7 @@ def _find_containers(soup: BeautifulSoup) -> list[dict[str, Any]]:
                         if meaningful_children
                         else (similar_children[0] if similar_children else None)
                     )
-                    sample_text = sample_child.get_text(strip=True)[:100] if sample_child else ""
+                    sample_text = text_prefix(sample_child, 100) if sample_child else ""
 
                     # Calculate content score for ranking
                     content_score = 0
@@ -388,33 +422,36 @@ def _calculate_statistics(soup: BeautifulSoup) -> dict[str, Any]:
     """Calculate page statistics."""
     stats: dict[str, Any] = {}
 
+    # Walk the tree once and tally everything from that single pass
+    tag_counter: Counter[str] = Counter()
+    class_counter: Counter[str] = Counter()
+    total_links = 0
+    for tag in soup.find_all(True):
+        tag_counter[tag.name] += 1
+        if tag.name == "a" and tag.get("href") is not None:
+            total_links += 1
+        for cls in _class_tokens(tag):
+            if cls:
+                class_counter[cls] += 1
+
     # Count elements
-    stats["total_elements"] = len(soup.find_all(True))
-    stats["total_links"] = len(soup.find_all("a", href=True))
-    stats["total_images"] = len(soup.find_all("img"))
-    stats["total_forms"] = len(soup.find_all("form"))
-    stats["total_tables"] = len(soup.find_all("table"))
-    stats["total_lists"] = len(soup.find_all(["ul", "ol"]))
+    stats["total_elements"] = tag_counter.total()
+    stats["total_links"] = total_links
+    stats["total_images"] = tag_counter["img"]
+    stats["total_forms"] = tag_counter["form"]
+    stats["total_tables"] = tag_counter["table"]
+    stats["total_lists"] = tag_counter["ul"] + tag_counter["ol"]
 
     # Count headings
-    stats["headings"] = {f"h{i}": len(soup.find_all(f"h{i}")) for i in range(1, 7)}
+    stats["headings"] = {f"h{i}": tag_counter[f"h{i}"] for i in range(1, 7)}
 
     # Text length
     text = soup.get_text(strip=True)
     stats["text_length"] = len(text)
     stats["text_words"] = len(text.split())
 
-    # Most common tags
-    tag_counter = Counter(tag.name for tag in soup.find_all(True))
+    # Most common tags and classes
     stats["most_common_tags"] = tag_counter.most_common(10)
-
-    # Most common classes
-    class_counter: Counter[str] = Counter()
-    for tag in soup.find_all(True):
-        classes = _get_element_classes(tag)
-        for cls in classes.split():
-            if cls:
-                class_counter[cls] += 1
     stats["most_common_classes"] = class_counter.most_common(10)
 
     return stats
@@ -750,12 +787,12 @@ def _strip_numeric_segments(selector: str) -> str:
     if not selector:
         return selector
 
-    cleaned = re.sub(r":nth-of-type\(\d+\)", "", selector)
-    cleaned = re.sub(r"#[^\s>]*?(?:19|20)\d{2}[^\s>]*", "", cleaned)
-    cleaned = re.sub(r"\.[^\s>]*?(?:19|20)\d{2}[^\s>]*", "", cleaned)
-    cleaned = re.sub(r"\s*\>\s*", " > ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    cleaned = re.sub(r"^(>\s*)+", "", cleaned).strip()
+    cleaned = _NTH_OF_TYPE_RE.sub("", selector)
+    cleaned = _YEAR_ID_RE.sub("", cleaned)
+    cleaned = _YEAR_CLASS_RE.sub("", cleaned)
+    cleaned = _CHILD_COMBINATOR_RE.sub(" > ", cleaned)
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip()
+    cleaned = _LEADING_COMBINATOR_RE.sub("", cleaned).strip()
 
     return cleaned or selector
 
@@ -770,10 +807,10 @@ def _is_stable_css_token(value: str) -> bool:
     if lowered.startswith(("css-", "sc-", "jsx-", "emotion-", "_", "slick-")):
         return False
 
-    if re.search(r"\d{4,}", value):
+    if _LONG_DIGIT_RUN_RE.search(value):
         return False
 
-    if re.search(r"\d{3,}$", value):
+    if _NUMERIC_SUFFIX_RE.search(value):
         return False
 
     return True
@@ -854,6 +891,81 @@ def _longest_common_prefix(values: list[str]) -> str:
     return prefix
 
 
+def _joined_attr(tag: Tag, name: str) -> str:
+    # Multi-valued attributes (class, rel) compare as their space-joined value
+    value = tag.get(name)
+    if value is None:
+        return ""
+    return " ".join(value) if isinstance(value, list) else str(value)
+
+
+def _scan_scroll_markup(soup: BeautifulSoup) -> dict[str, Any]:
+    """
+    Collect the element-level infinite scroll signals in one tree walk.
+
+    Equivalent to selecting ``a.next, a[rel='next'], .pagination a, a.page-link,
+    nav[aria-label*='pagination' i]`` (pagination), ``.loading, .spinner, .loader,
+    [class*='load-more'], [id*='load-more']`` (first loading indicator),
+    ``[data-page], [data-offset], [data-cursor]`` and scanning ``<script>`` text,
+    without a separate soupsieve pass over the document for each.
+    """
+    has_pagination = False
+    loading_indicator: Tag | None = None
+    has_paging_data = False
+    has_scroll_script = False
+
+    for element in soup.find_all(True):
+        name = element.name.lower()
+        classes = _class_tokens(element)
+
+        if not has_pagination:
+            if name == "a":
+                has_pagination = (
+                    "next" in classes
+                    or "page-link" in classes
+                    or _joined_attr(element, "rel") == "next"
+                    or any("pagination" in _class_tokens(parent) for parent in element.parents)
+                )
+            elif name == "nav":
+                has_pagination = "pagination" in _joined_attr(element, "aria-label").lower()
+
+        if loading_indicator is None and (
+            "loading" in classes
+            or "spinner" in classes
+            or "loader" in classes
+            or "load-more" in _joined_attr(element, "class")
+            or "load-more" in _joined_attr(element, "id")
+        ):
+            loading_indicator = element
+
+        if not has_paging_data:
+            attrs = element.attrs
+            has_paging_data = (
+                "data-page" in attrs or "data-offset" in attrs or "data-cursor" in attrs
+            )
+
+        if not has_scroll_script and name == "script":
+            script_text = (element.string or "").lower()
+            has_scroll_script = any(
+                pattern in script_text for pattern in ["scroll", "onscroll", "scrolltop"]
+            )
+
+        if (
+            has_pagination
+            and has_paging_data
+            and has_scroll_script
+            and loading_indicator is not None
+        ):
+            break
+
+    return {
+        "has_pagination": has_pagination,
+        "loading_indicator": loading_indicator,
+        "has_paging_data": has_paging_data,
+        "has_scroll_script": has_scroll_script,
+    }
+
+
 def _detect_infinite_scroll(soup: BeautifulSoup) -> dict[str, Any]:
     """
     Detect if page uses infinite scroll instead of traditional pagination.
@@ -872,17 +984,18 @@ def _detect_infinite_scroll(soup: BeautifulSoup) -> dict[str, Any]:
 
     # Check for common infinite scroll libraries/patterns
     html_str = str(soup)
+    html_lower = html_str.lower()
 
     # JavaScript libraries for infinite scroll
-    if "infinite-scroll" in html_str.lower():
+    if "infinite-scroll" in html_lower:
         score += 30
         signals.append("infinite-scroll library detected")
 
-    if "waypoint" in html_str.lower():
+    if "waypoint" in html_lower:
         score += 25
         signals.append("Waypoints.js (scroll detection library)")
 
-    if "intersection observer" in html_str.lower() or "intersectionobserver" in html_str.lower():
+    if "intersection observer" in html_lower or "intersectionobserver" in html_lower:
         score += 30
         signals.append("IntersectionObserver API (modern infinite scroll)")
 
@@ -891,38 +1004,28 @@ def _detect_infinite_scroll(soup: BeautifulSoup) -> dict[str, Any]:
         score += 35
         signals.append("React/Vue infinite scroll component")
 
-    # Check for absence of traditional pagination
-    has_pagination = bool(
-        soup.select(
-            "a.next, a[rel='next'], .pagination a, a.page-link, nav[aria-label*='pagination' i]"
-        )
-    )
+    markup = _scan_scroll_markup(soup)
 
-    if not has_pagination:
+    # Check for absence of traditional pagination
+    if not markup["has_pagination"]:
         score += 20
         signals.append("No traditional pagination links found")
 
     # Check for loading indicators (common in infinite scroll)
-    loading_indicators = soup.select(
-        ".loading, .spinner, .loader, [class*='load-more'], [id*='load-more']"
-    )
-    if loading_indicators:
+    loading_indicator = markup["loading_indicator"]
+    if loading_indicator is not None:
         score += 15
-        first_classes = loading_indicators[0].get("class")
+        first_classes = loading_indicator.get("class")
         class_name = first_classes[0] if isinstance(first_classes, list) and first_classes else ""
         signals.append(f"Loading indicator found: {class_name}")
 
     # Check for scroll event listeners in scripts
-    scripts = soup.find_all("script")
-    for script in scripts:
-        script_text = script.string or ""
-        if any(pattern in script_text.lower() for pattern in ["scroll", "onscroll", "scrolltop"]):
-            score += 10
-            signals.append("Scroll event handlers in JavaScript")
-            break
+    if markup["has_scroll_script"]:
+        score += 10
+        signals.append("Scroll event handlers in JavaScript")
 
     # Data attributes suggesting dynamic loading
-    if soup.select("[data-page], [data-offset], [data-cursor]"):
+    if markup["has_paging_data"]:
         score += 20
         signals.append("Pagination data attributes (likely API-driven)")
 
@@ -972,10 +1075,10 @@ def _detect_pagination_links(soup: BeautifulSoup) -> list[dict[str, Any]]:
             hints.append("class match")
 
         # Textual matches
-        if re.search(r"\b(next|older|more|weiter|nächste|suivant)\b", text, re.I):
+        if _NEXT_TEXT_RE.search(text):
             score += 40
             hints.append("link text")
-        if re.search(r"[»\u203A→⟩⟫]", text):
+        if _NEXT_ARROW_RE.search(text):
             score += 15
             hints.append("arrow symbol")
 
@@ -1010,85 +1113,116 @@ def _detect_pagination_links(soup: BeautifulSoup) -> list[dict[str, Any]]:
     return ranked[:6]
 
 
+# Enhanced field patterns with more comprehensive selectors
+_FIELD_PATTERNS: list[tuple[str, list[str]]] = [
+    (
+        "title",
+        [
+            "h1",
+            "h2",
+            "h3",
+            "h4",
+            ".title",
+            ".headline",
+            ".heading",
+            ".name",
+            ".card-title",
+            "a.title",
+            "a.headline",
+            "strong span",
+            "a strong span",
+            ".archive strong span",
+        ],
+    ),
+    (
+        "link",
+        [
+            "a[href]",
+            "h1 a",
+            "h2 a",
+            "h3 a",  # Links in headings
+            ".title a",
+            ".headline a",
+        ],
+    ),
+    (
+        "image",
+        ["img[src]", "picture img", ".thumbnail img", ".featured-image img", ".card-img"],
+    ),
+    (
+        "description",
+        [
+            "p",
+            ".description",
+            ".summary",
+            ".excerpt",
+            ".lead",
+            ".snippet",
+            ".card-text",
+            ".body",
+            ".content",
+        ],
+    ),
+    (
+        "date",
+        [
+            "time",
+            "time[datetime]",
+            ".date",
+            ".published",
+            ".timestamp",
+            ".pubdate",
+            ".post-date",
+            ".article-date",
+        ],
+    ),
+    (
+        "author",
+        [".author", ".byline", ".by", ".username", ".writer", "address", ".author-name"],
+    ),
+    ("price", [".price", ".cost", ".amount", ".value", ".sale-price", ".current-price"]),
+    ("category", [".category", ".tag", ".label", ".section", ".topic", ".post-category"]),
+]
+
+
+def _subject_requirements(selector: str) -> tuple[str | None, frozenset[str]]:
+    """Tag and classes the element matched by ``selector`` must itself carry.
+
+    Only the rightmost compound is considered: ancestor parts may match
+    elements outside the item, so they can't be used to rule a selector out.
+    """
+    subject = selector.rsplit(maxsplit=1)[-1].lower()
+    tag = re.match(r"[a-z][\w-]*", subject)
+    return (tag.group(0) if tag else None, frozenset(re.findall(r"\.([\w-]+)", subject)))
+
+
+# Field patterns with each selector's subject requirements, computed once
+_FIELD_SELECTORS = [
+    (field_name, [(selector, *_subject_requirements(selector)) for selector in selectors])
+    for field_name, selectors in _FIELD_PATTERNS
+]
+
+
 def _suggest_fields(item: Tag) -> list[dict[str, Any]]:
     """Suggest field selectors within an item."""
     fields = []
     seen_selectors = set()  # Avoid duplicates
 
-    # Enhanced field patterns with more comprehensive selectors
-    patterns = [
-        (
-            "title",
-            [
-                "h1",
-                "h2",
-                "h3",
-                "h4",
-                ".title",
-                ".headline",
-                ".heading",
-                ".name",
-                ".card-title",
-                "a.title",
-                "a.headline",
-                "strong span",
-                "a strong span",
-                ".archive strong span",
-            ],
-        ),
-        (
-            "link",
-            [
-                "a[href]",
-                "h1 a",
-                "h2 a",
-                "h3 a",  # Links in headings
-                ".title a",
-                ".headline a",
-            ],
-        ),
-        (
-            "image",
-            ["img[src]", "picture img", ".thumbnail img", ".featured-image img", ".card-img"],
-        ),
-        (
-            "description",
-            [
-                "p",
-                ".description",
-                ".summary",
-                ".excerpt",
-                ".lead",
-                ".snippet",
-                ".card-text",
-                ".body",
-                ".content",
-            ],
-        ),
-        (
-            "date",
-            [
-                "time",
-                "time[datetime]",
-                ".date",
-                ".published",
-                ".timestamp",
-                ".pubdate",
-                ".post-date",
-                ".article-date",
-            ],
-        ),
-        (
-            "author",
-            [".author", ".byline", ".by", ".username", ".writer", "address", ".author-name"],
-        ),
-        ("price", [".price", ".cost", ".amount", ".value", ".sale-price", ".current-price"]),
-        ("category", [".category", ".tag", ".label", ".section", ".topic", ".post-category"]),
-    ]
+    # One walk of the item collects which tags and classes exist, so selectors
+    # whose target can't be present are skipped without a soupsieve pass
+    item_tags: set[str] = set()
+    item_classes: set[str] = set()
+    for descendant in item.find_all(True):
+        item_tags.add(descendant.name.lower())
+        item_classes.update(cls.lower() for cls in _class_tokens(descendant))
 
     # Try each field pattern
-    for field_name, selectors in patterns:
-        for selector in selectors:
+    for field_name, selectors in _FIELD_SELECTORS:
+        for selector, required_tag, required_classes in selectors:
+            if required_tag is not None and required_tag not in item_tags:
+                continue
+            if not required_classes <= item_classes:
+                continue
             try:
                 elements = item.select(selector)
                 if elements:
@@ -6,6 +6,8 @@ from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from quarry.lib import serialization
+
 
 class Exporter(ABC):
     """
@@ -63,7 +65,7 @@ class Exporter(ABC):
                     continue
 
                 try:
-                    record = json.loads(line)
+                    record = serialization.loads(line)
                     self.stats["records_read"] += 1
                     yield record
                 except json.JSONDecodeError:
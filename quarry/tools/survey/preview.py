@@ -45,7 +45,7 @@ def preview_extraction(html: str, schema: ExtractionSchema, limit: int = 5) -> l
                 if field_schema.multiple:
                     elements = select_list(item_elem, field_schema.selector)
                 else:
-                    elements = select_list(item_elem, field_schema.selector)[:1]
+                    elements = select_list(item_elem, field_schema.selector, limit=1)
 
                 if not elements:
                     # No match found
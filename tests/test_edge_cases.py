@@ -1,7 +1,12 @@
 """Tests for edge cases and error handling."""
 
+from quarry import inspector
 from quarry.inspector import find_item_selector, inspect_html, preview_extraction
 
+# Test constants
+NAV_LINKS = 12
+MAX_SAMPLE_LINKS = 10
+
 
 def test_inspect_html_empty_string():
     """Empty HTML returns safe defaults."""
@@ -25,6 +30,15 @@ def test_inspect_html_minimal():
     assert "total_links" in result
 
 
+def test_inspect_html_counts_links_and_classes():
+    """Links with any href are counted; repeated classes come from the same walk."""
+    html = "".join(f'<a class="nav" href="/{i}">Link {i}</a>' for i in range(NAV_LINKS))
+    result = inspect_html(f'<html><body>{html}<a href="">Empty</a><a>No href</a></body></html>')
+    assert result["total_links"] == NAV_LINKS + 1
+    assert len(result["sample_links"]) == MAX_SAMPLE_LINKS
+    assert result["repeated_classes"][0]["class"] == "nav"
+
+
 def test_find_item_selector_empty_html():
     """Empty HTML returns empty candidates list."""
     candidates = find_item_selector("")
@@ -104,6 +118,25 @@ def test_preview_extraction_empty_html():
     assert result == []
 
 
+def test_helpers_reuse_caller_soup(monkeypatch):
+    """A soup passed by the caller is used as-is instead of parsing the page again."""
+    names = ("Alpha", "Bravo", "Charlie")
+    items = "".join(f"<li class='item'><a href='/{n.lower()}'>{n}</a></li>" for n in names)
+    html = f"<ul>{items}</ul>"
+    expected_inspect = inspect_html(html)
+    expected_items = find_item_selector(html, min_items=3)
+    soup = inspector.parse_html(html)
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("html should not be parsed again")
+
+    monkeypatch.setattr(inspector, "parse_html", fail_parse)
+    assert inspect_html(html, soup=soup) == expected_inspect
+    assert find_item_selector(html, min_items=3, soup=soup) == expected_items
+    records = preview_extraction(html, "li.item", {"link": "a::attr(href)"}, soup=soup)
+    assert records == [{"link": f"/{n.lower()}"} for n in names]
+
+
 def test_preview_extraction_invalid_selector():
     """Invalid item selector returns empty preview."""
     html = "<html><body><div class='item'>Test</div></body></html>"
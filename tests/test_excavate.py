@@ -3,6 +3,9 @@
 import pytest
 from pathlib import Path
 
+from bs4 import BeautifulSoup
+
+from quarry.lib.bs4_utils import compile_selector, select_list
 from quarry.lib.schemas import ExtractionSchema, FieldSchema, PaginationSchema
 from quarry.tools.excavate.parser import SchemaParser
 from quarry.tools.excavate.executor import ExcavateExecutor
@@ -425,3 +428,21 @@ class TestIntegration:
 
         # Should extract something
         assert len(items) >= 0  # May be empty depending on fixture
+
+
+def test_field_selectors_compiled_once():
+    """Field selectors are compiled once and reused across items."""
+    compile_selector.cache_clear()
+    html = "<ul>" + "".join(f"<li class='row'><b>{i}</b></li>" for i in range(5)) + "</ul>"
+    schema = ExtractionSchema(
+        name="rows",
+        item_selector="li.row",
+        fields={"n": FieldSchema(selector="b")},
+    )
+
+    items = SchemaParser(schema).parse(html)
+
+    assert [item["n"] for item in items] == ["0", "1", "2", "3", "4"]
+    # One compile for the item selector, one for the field selector
+    assert compile_selector.cache_info().misses == len([schema.item_selector, "b"])
+    assert select_list(BeautifulSoup(html, "html.parser"), "li[", limit=1) == []
@@ -1,15 +1,23 @@
 """Tests for framework confidence scoring system."""
 
+from bs4 import BeautifulSoup
+
 from quarry.framework_profiles import (
+    FRAMEWORK_PROFILES,
+    BootstrapProfile,
     DjangoAdminProfile,
     DrupalViewsProfile,
     NextJSProfile,
     ReactComponentProfile,
     TailwindProfile,
     VueJSProfile,
+    WordPressProfile,
+    contains_any_marker,
     detect_all_frameworks,
     detect_framework,
+    scan_markers,
 )
+from quarry.framework_profiles import base as profiles_base
 
 
 def test_confidence_scoring():
@@ -201,3 +209,87 @@ def test_react_false_positive_prevention():
     html2 = '<div id="app" data-reactroot=""><h1>My App</h1></div>'
     score2 = ReactComponentProfile.detect(html2)
     assert score2 >= 40, "Should detect React with data-reactroot"
+
+
+def test_marker_scan_matches_substring_fallback(monkeypatch):
+    """Test that the single-pass marker scan agrees with per-marker substring checks."""
+    html = """
+    <html><head><script src="/_next/static/react-dom.js"></script></head>
+    <body><div id="__next" class="views-row card row col-md-4 flex p-4">
+        <span itemprop="name" v-if="show">wp-content product-title</span>
+    </div></body></html>
+    """
+    markers = tuple(m for profile in FRAMEWORK_PROFILES for m in profile.markers)
+    scores = [(profile, profile.detect(html)) for profile in FRAMEWORK_PROFILES]
+    found = scan_markers(html, markers)
+
+    monkeypatch.setattr(profiles_base, "ahocorasick", None)
+    assert scan_markers(html, markers) == found
+    assert found == {m for m in markers if m in html}
+    assert [(profile, profile.detect(html)) for profile in FRAMEWORK_PROFILES] == scores
+    assert [
+        (profile, profile.detect(html, found=found)) for profile in FRAMEWORK_PROFILES
+    ] == scores
+    folded = profiles_base.fold_ascii_case(html)
+    assert [
+        (profile, profile.detect(html, found=found, folded=folded))
+        for profile in FRAMEWORK_PROFILES
+    ] == scores
+
+
+def test_contains_any_marker_matches_substring_fallback(monkeypatch):
+    """Test that the any-marker check agrees with per-marker substring checks."""
+    markers = tuple(m for profile in FRAMEWORK_PROFILES for m in profile.markers)
+    texts = ["", "plain text", "views-row odd", "x wp-content y", markers[-1]]
+    expected = [any(m in text for m in markers) for text in texts]
+
+    assert [contains_any_marker(text, markers) for text in texts] == expected
+    monkeypatch.setattr(profiles_base, "ahocorasick", None)
+    assert [contains_any_marker(text, markers) for text in texts] == expected
+
+
+def test_contains_ignore_case_matches_lower():
+    """Test that the ASCII case-folded search agrees with str.lower() substring checks."""
+    pages = [
+        '<script src="https://cdn.Shopify.com/s/x.js"></script>',
+        "<p>SHOP\u0130FY and \u017fhopify are not matches</p><script src='Vue.JS'></script>",
+        "<p>Ünïcödé only \udcff</p>",
+    ]
+    for html in pages:
+        folded = profiles_base.fold_ascii_case(html)
+        for needle in ("shopify", "vue.js"):
+            expected = needle in html.lower()
+            assert profiles_base.contains_ignore_case(html, needle) == expected
+            assert profiles_base.contains_ignore_case(html, needle, folded) == expected
+
+
+def test_detection_is_memoized_per_page_and_item_classes():
+    """Test that repeat detection reuses cached scores but still honours item classes."""
+    html = '<div class="views-row"><span class="field-content">A</span></div>'
+    item = BeautifulSoup(html, "html.parser").div
+
+    first = detect_all_frameworks(html)
+    assert detect_all_frameworks(html) == first
+    assert detect_all_frameworks(html, item) != first
+    assert detect_framework(html, item) is DrupalViewsProfile
+
+
+def test_item_class_boost_uses_whole_tokens():
+    """Test that item class boosts match class tokens, not substrings of other classes."""
+    html = "<div>plain page</div>"
+
+    def item(classes: str):
+        return BeautifulSoup(f'<div class="{classes}"></div>', "html.parser").div
+
+    base = WordPressProfile.detect(html)
+    assert WordPressProfile.detect(html, item("impost")) == base
+    assert WordPressProfile.detect(html, item("post-123 status-publish")) == base + 20
+    assert WordPressProfile.detect(html, item("hentry")) == base + 20
+
+    assert BootstrapProfile.detect(html, item("scorecard")) == BootstrapProfile.detect(html)
+    assert BootstrapProfile.detect(html, item("card h-100")) == BootstrapProfile.detect(html) + 20
+    # Callers that already tokenized the item's classes can pass them in
+    drupal_item = item("views-row")
+    assert DrupalViewsProfile.detect(
+        html, drupal_item, item_classes=frozenset({"views-row"})
+    ) == DrupalViewsProfile.detect(html, drupal_item)
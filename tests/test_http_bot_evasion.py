@@ -3,6 +3,8 @@
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
+from requests.cookies import MockRequest, create_cookie
 
 from quarry.lib.http import _build_browser_headers, _check_robots_txt, create_session, get_html
 
@@ -135,3 +137,49 @@ def test_get_html_can_skip_robots_txt():
             # Should not call robots.txt check
             get_html("https://example.com/page", respect_robots=False)
             mock_check.assert_not_called()
+
+
+def test_get_html_reuses_default_session():
+    """get_html pools connections through one session per thread."""
+    sessions = []
+
+    def fake_get(self, url, **kwargs):
+        sessions.append(self)
+        response = Mock()
+        response.text = "<html>Test</html>"
+        return response
+
+    with patch("quarry.lib.http.requests.Session.get", fake_get):
+        get_html("https://example.com/a", respect_robots=False)
+        get_html("https://example.com/b", respect_robots=False)
+        explicit = create_session()
+        get_html("https://example.com/c", respect_robots=False, session=explicit)
+
+    assert sessions[0] is sessions[1]
+    assert sessions[2] is explicit
+
+
+def test_default_session_keeps_no_state(monkeypatch):
+    """The shared default session rejects cookies and is never given a proxy."""
+    calls = []
+
+    def fake_get(self, url, **kwargs):
+        calls.append((self, kwargs))
+        response = Mock()
+        response.text = "<html>Test</html>"
+        return response
+
+    monkeypatch.setenv("PROXY_URL", "http://proxy.example:8080")
+    with patch("quarry.lib.http.requests.Session.get", fake_get):
+        get_html("https://example.com/a", respect_robots=False)
+
+    session, kwargs = calls[0]
+    assert kwargs["proxies"] == {
+        "http": "http://proxy.example:8080",
+        "https": "http://proxy.example:8080",
+    }
+    assert not session.proxies
+
+    request = MockRequest(requests.Request("GET", "https://example.com/").prepare())
+    cookie = create_cookie("sid", "1", domain="example.com")
+    assert not session.cookies.get_policy().set_ok(cookie, request)
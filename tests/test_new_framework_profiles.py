@@ -1,12 +1,20 @@
 """Tests for new framework profiles (Django, Next.js, React, Vue.js)."""
 
+from bs4 import BeautifulSoup
+
 from quarry.framework_profiles import (
+    FRAMEWORK_PROFILES,
     DjangoAdminProfile,
     NextJSProfile,
     ReactComponentProfile,
+    SchemaOrgProfile,
     VueJSProfile,
+    WooCommerceProfile,
     detect_framework,
+    is_framework_pattern,
 )
+from quarry.framework_profiles import base as profiles_base
+from quarry.framework_profiles.universal import schema_org
 from quarry.inspector import find_item_selector
 
 
@@ -301,6 +309,74 @@ def test_react_field_mappings():
     assert desc_selector is not None, "Should find description selector"
 
 
+def test_field_mappings_compiled_once():
+    """Test that parsed field patterns are cached and bare tag patterns still match."""
+    assert WooCommerceProfile._compiled_mappings() is WooCommerceProfile._compiled_mappings()
+
+    soup = BeautifulSoup('<li><a class="plain" href="/p/1">Item</a></li>', "html.parser")
+    item = soup.find("li")
+    assert WooCommerceProfile.generate_field_selector(item, "link") == "a::attr(href)"
+
+
+def test_is_framework_pattern_uses_hints_and_field_patterns():
+    """Test that selectors are matched against item hints and attr-stripped field patterns."""
+    assert WooCommerceProfile._known_patterns() is WooCommerceProfile._known_patterns()
+    assert is_framework_pattern("li.product", WooCommerceProfile)
+    assert is_framework_pattern(".price .amount", WooCommerceProfile)
+    assert is_framework_pattern("span.onsale.big", WooCommerceProfile)
+    assert is_framework_pattern("a", WooCommerceProfile)
+    assert not is_framework_pattern("ul > li", WooCommerceProfile)
+    assert not is_framework_pattern("li.product", None)
+
+
+def test_json_ld_extraction_only_parses_pages_with_json_ld(monkeypatch):
+    """Test that JSON-LD blocks are read from script tags and plain pages skip parsing."""
+    html = """
+    <html><head>
+    <script type="application/ld+json">{"@type": "Article", "headline": "Hello"}</script>
+    <script type="text/javascript">var x = 1;</script>
+    </head><body><div><script type="application/ld+json">{broken</script></div></body></html>
+    """
+    assert SchemaOrgProfile._extract_json_ld(html) == [{"@type": "Article", "headline": "Hello"}]
+    assert SchemaOrgProfile.extract_json_ld_fields(html)["title"] == "Hello"
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("page without JSON-LD should not be parsed")
+
+    monkeypatch.setattr(schema_org, "parse_html", fail_parse)
+    assert SchemaOrgProfile._extract_json_ld("<div itemscope>No scripts</div>") == []
+
+
+def test_field_selector_xpath_matches_bs4_fallback(monkeypatch):
+    """Test that the lxml evaluation path picks the same selectors as the bs4 path."""
+    html = """
+    <li class="views-row product type-product">
+        <h2 class="woocommerce-loop-product__title entry-title"><a href="/p/1">Item</a></h2>
+        <span class="price"><span class="woocommerce-Price-amount">$5</span></span>
+        <time datetime="2025-01-15" class="PostDate">Jan 15</time>
+        <div class="views-field-body" data-testid="Card-Title" @click="go">Body</div>
+        <img src="/x.png" itemprop="image">
+    </li>
+    """
+    item = BeautifulSoup(html, "html.parser").find("li")
+    cases = [(p, f) for p in FRAMEWORK_PROFILES for f in p.get_field_mappings()]
+    selected = [p.generate_field_selector(item, f) for p, f in cases]
+
+    monkeypatch.setattr(profiles_base, "etree", None)
+    assert [p.generate_field_selector(item, f) for p, f in cases] == selected
+    assert any(selected)
+
+
+def test_field_selector_sees_item_changes_between_calls():
+    """Test that a field selector reflects edits made to the item since the last call."""
+    html = '<article><h2 class="entry-title"><a href="/p">Post</a></h2><time>Jan</time></article>'
+    item = BeautifulSoup(html, "html.parser").article
+
+    assert NextJSProfile.generate_field_selector(item, "date") == "time"
+    item.time.decompose()
+    assert NextJSProfile.generate_field_selector(item, "date") != "time"
+
+
 def test_framework_priority_order():
     """Test that more specific frameworks are detected before generic ones."""
     # Django Admin should be detected before generic patterns
@@ -79,6 +79,21 @@ def test_fda_cursor_filtering() -> None:
         assert filtered_records[0]["id"] == records[0]["id"]
 
 
+def test_nws_cursor_filtering() -> None:
+    """Test that NWS cursor stops collection at seen item and respects max_items."""
+    entry_url = "https://alerts.weather.gov/cap/us.php?x=0"
+    connector = nws.NWSConnector(entry_url=entry_url)
+    records, _ = connector.collect(cursor=None, max_items=10, offline=True)
+
+    if len(records) >= MIN_RECORDS_FOR_CURSOR_TEST:
+        cursor_id = records[1]["id"]
+        filtered_records, _ = connector.collect(cursor=cursor_id, max_items=10, offline=True)
+        assert [r["id"] for r in filtered_records] == [records[0]["id"]]
+
+    unknown_cursor, _ = connector.collect(cursor="not-a-real-id", max_items=1, offline=True)
+    assert len(unknown_cursor) == 1
+
+
 def test_fda_deprecation_warning() -> None:
     """Test that FDAConnector without entry_url emits DeprecationWarning."""
     with pytest.warns(DeprecationWarning, match="missing entry_url"):
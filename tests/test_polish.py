@@ -84,6 +84,20 @@ class TestDeduplicator:
         assert not dedup.is_duplicate(record1)
         assert dedup.is_duplicate(record2)  # Same data, different meta
 
+    def test_nan_and_none_are_distinct(self):
+        """Test that a NaN value does not collide with None in the record hash."""
+        dedup = Deduplicator(strategy="first")
+
+        assert not dedup.is_duplicate({"title": "Item 1", "price": float("nan")})
+        assert not dedup.is_duplicate({"title": "Item 1", "price": None})
+
+    def test_lone_surrogate_is_hashed(self):
+        """Test that a string with a lone surrogate can still be hashed."""
+        dedup = Deduplicator(strategy="first")
+
+        assert not dedup.is_duplicate({"title": "Item \ud800"})
+        assert dedup.is_duplicate({"title": "Item \ud800"})
+
 
 class TestTransformers:
     """Test transformation functions."""
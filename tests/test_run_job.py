@@ -3,10 +3,13 @@
 import tempfile
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
+import quarry.sinks.parquet as parquet_mod
 from quarry.connectors import custom
-from quarry.core import load_yaml, run_job
+from quarry.core import _apply_transform_pipeline, load_yaml, run_job
+from quarry.sinks.parquet import ParquetSink
 from quarry.state import load_cursor
 
 # Test constants to avoid magic numbers
@@ -22,6 +25,46 @@ def test_load_yaml() -> None:
     assert job_dict["source"]["parser"] == "fda_list"
 
 
+def test_load_yaml_cache_tracks_edits(tmp_path) -> None:
+    """Test that cached job specs are copied per call and reloaded after edits."""
+    job_file = tmp_path / "job.yml"
+    spec = Path("examples/jobs/fda.yml").read_text()
+    job_file.write_text(spec)
+
+    first = load_yaml(str(job_file))
+    first["job"] = "mutated"
+    assert load_yaml(str(job_file))["job"] == "fda_recalls"
+
+    job_file.write_text(spec.replace("job: fda_recalls", "job: fda_recalls_edited"))
+    assert load_yaml(str(job_file))["job"] == "fda_recalls_edited"
+
+
+def test_parquet_sink_writes_in_batches(tmp_path, monkeypatch) -> None:
+    """Test that batched Parquet writes round-trip the whole frame."""
+    monkeypatch.setattr(parquet_mod, "_BATCH_ROWS", 4)
+    df = pd.DataFrame(
+        {"id": [str(i) for i in range(10)], "note": [None] * 5 + ["x"] * 5, "n": range(10)}
+    )
+
+    path = ParquetSink(str(tmp_path / "{job}.parquet")).write(df, job="batched")
+
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+
+
+def test_apply_transform_pipeline() -> None:
+    """Test that the pipeline handles empty input, raw records and normalize steps."""
+    records = [{"id": "a", "title": "A", "url": "https://example.com/a"}]
+
+    assert _apply_transform_pipeline([], {"pipeline": [{"normalize": "generic"}]}).empty
+    assert list(_apply_transform_pipeline(records, {})["id"]) == ["a"]
+
+    normalized = _apply_transform_pipeline(records, {"pipeline": [{"normalize": "custom"}]})
+    assert "source" in normalized.columns
+
+    with pytest.raises(ValueError, match="Unknown normalize function"):
+        _apply_transform_pipeline(records, {"pipeline": [{"normalize": "missing"}]})
+
+
 def test_run_fda_job_offline() -> None:
     """Test running FDA job offline."""
     with tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False) as f:
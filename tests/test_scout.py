@@ -4,7 +4,9 @@ from pathlib import Path
 
 import pytest
 
-from quarry.tools.scout.analyzer import analyze_page
+from quarry.lib.bs4_utils import parse_html, text_prefix
+from quarry.tools.scout import analyzer
+from quarry.tools.scout.analyzer import _detect_infinite_scroll, _suggest_fields, analyze_page
 from quarry.tools.scout.reporter import format_as_json, format_as_terminal
 
 
@@ -78,6 +80,38 @@ class TestScoutAnalyzer:
         assert result["containers"] == []
         assert result["metadata"] == {}
 
+    def test_suggest_fields_descendant_and_class_selectors(self):
+        """Test that descendant and class field selectors match while absent ones are skipped."""
+        soup = parse_html(
+            '<div class="archive"><li><strong><span>Item title</span></strong>'
+            '<span class="byline">By Ann</span></li></div>'
+        )
+        fields = {f["name"]: f["selector"] for f in _suggest_fields(soup.li)}
+
+        assert fields["title"] == "strong span"
+        assert fields["author"] == ".byline"
+        assert "date" not in fields
+
+    def test_detect_infinite_scroll_markup_signals(self):
+        """Test pagination, loader, data-attribute and script signals from one document."""
+        paged = parse_html('<ul class="pagination"><li><a href="/2">2</a></li></ul>')
+        paged_signals = _detect_infinite_scroll(paged)["signals"]
+        assert "No traditional pagination links found" not in paged_signals
+
+        scrolling = parse_html(
+            '<div id="feed" data-cursor="abc"></div>'
+            '<div class="btn load-more-button">More</div>'
+            "<script>window.addEventListener('scroll', load)</script>"
+        )
+        result = _detect_infinite_scroll(scrolling)
+        assert result["detected"]
+        assert result["signals"] == [
+            "No traditional pagination links found",
+            "Loading indicator found: btn",
+            "Scroll event handlers in JavaScript",
+            "Pagination data attributes (likely API-driven)",
+        ]
+
 
 class TestScoutReporter:
     """Test the Scout reporter."""
@@ -154,3 +188,26 @@ class TestScoutReporter:
         assert "Test Page" in result
         assert "bootstrap" in result.lower()
         assert ".item" in result
+
+
+def test_analyze_page_reuses_caller_soup(monkeypatch):
+    """Test that a pre-parsed soup is used as-is instead of parsing the page again."""
+    html = "<ul>" + "".join(f"<li class='row'><a href='/{i}'>Item {i}</a></li>" for i in range(5))
+    html += "</ul>"
+    expected = analyze_page(html)
+    soup = parse_html(html)
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("html should not be parsed again")
+
+    monkeypatch.setattr(analyzer, "parse_html", fail_parse)
+    assert analyze_page(html, soup=soup) == expected
+
+
+def test_text_prefix_matches_get_text():
+    """Test that the bounded text sample equals a slice of the full stripped text."""
+    body = "<div class='post'><h2> Title </h2><!-- note --><p>" + "word " * 200 + "</p></div>"
+    root = parse_html(f"<html><body>{body}<script>var x = 1;</script></body></html>").body
+    for tag in [root, *root.find_all(True)]:
+        for limit in (0, 3, 100):
+            assert text_prefix(tag, limit) == tag.get_text(strip=True)[:limit]
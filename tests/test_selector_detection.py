@@ -7,7 +7,12 @@ Tests wizard's ability to detect correct selectors on actual websites.
 import pytest
 from bs4 import BeautifulSoup
 
-from quarry.inspector import find_item_selector, generate_field_selector
+from quarry import inspector
+from quarry.inspector import (
+    find_item_selector,
+    generate_field_selector,
+    generate_field_selectors,
+)
 
 
 class TestRealWorldSelectorDetection:
@@ -375,6 +380,31 @@ class TestRealWorldSelectorDetection:
         title_selector = generate_field_selector(item, 'title')
         assert title_selector is not None
 
+    def test_field_selectors_share_one_item_analysis(self, monkeypatch):
+        """Test that several fields of one item are resolved from a single field analysis."""
+        html = '''
+        <div class="list">
+          <div class="entry"><h2><a href="/a">First</a></h2><time>2024-01-01</time></div>
+          <div class="entry"><h2><a href="/b">Second</a></h2><time>2024-01-02</time></div>
+        </div>
+        '''
+        calls = []
+        suggest_fields = inspector._suggest_fields
+
+        def counting_suggest_fields(item):
+            calls.append(item)
+            return suggest_fields(item)
+
+        monkeypatch.setattr(inspector, "_suggest_fields", counting_suggest_fields)
+        item = BeautifulSoup(html, 'html.parser').select_one('.entry')
+        fields = ['title', 'date', 'author']
+
+        selectors = generate_field_selectors(item, fields)
+        assert calls == [item]
+        assert selectors == {field: generate_field_selector(item, field) for field in fields}
+        assert selectors['title'] is not None
+        assert selectors['date'] is not None and "time" in selectors['date']
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
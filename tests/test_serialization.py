@@ -0,0 +1,70 @@
+"""Tests for record JSON serialization helpers."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from quarry.lib import serialization
+
+RECORD = {"id": "001", "title": "Café", "tags": ["a", "b"], "n": 7, "score": 0.5, "x": None}
+RECORD_TEXT = '{"id":"001","n":7,"score":0.5,"tags":["a","b"],"title":"Café","x":null}'
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def use_orjson(request, monkeypatch) -> bool:
+    """Run a test against the orjson path and against the stdlib fallback."""
+    if request.param:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_dumps_loads_round_trip(use_orjson: bool) -> None:
+    """Test that both paths write the same compact text and round-trip records."""
+    text = serialization.dumps(RECORD, sort_keys=True, default=str)
+    assert text == RECORD_TEXT
+    assert serialization.loads(text) == RECORD
+
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads("{not json")
+
+
+def test_dumps_keeps_non_finite_floats(use_orjson: bool) -> None:
+    """Test that NaN and Infinity are written as literals, never as null."""
+    text = serialization.dumps({"a": float("nan"), "b": [float("inf")], "c": None})
+    assert text == '{"a":NaN,"b":[Infinity],"c":null}'
+
+
+def test_dumps_falls_back_for_wide_integers(use_orjson: bool) -> None:
+    """Test that integers wider than 64 bits are encoded by the stdlib."""
+    text = serialization.dumps({"n": 2**70, "t": "é"})
+    assert text == '{"n":1180591620717411303424,"t":"é"}'
+    assert serialization.loads(text) == {"n": 2**70, "t": "é"}
+
+
+def test_dumps_matches_stdlib_for_exponent_floats(use_orjson: bool) -> None:
+    """Test that floats the stdlib writes in exponent form come out the same on both paths."""
+    values = {"big": 1e20, "small": 2.5e-05, "tiny": 1.5e-07, "plain": 0.0001}
+    text = serialization.dumps(values)
+    assert text == json.dumps(values, separators=(",", ":"))
+    assert serialization.loads(text) == values
+
+
+def test_dumps_hands_datetimes_to_default(use_orjson: bool) -> None:
+    """Test that datetimes go through default, and raise without one, on both paths."""
+    record = {"seen": datetime(2024, 1, 2, 3, 4, 5)}
+    assert serialization.dumps(record, default=str) == '{"seen":"2024-01-02 03:04:05"}'
+
+    with pytest.raises(TypeError):
+        serialization.dumps(record)
+
+
+def test_dumps_escapes_lone_surrogates(use_orjson: bool) -> None:
+    """Test that a lone surrogate is escaped so the text still encodes as UTF-8."""
+    record = {"t": "\ud800x", "u": "é"}
+    text = serialization.dumps(record)
+    assert text == '{"t":"\\ud800x","u":"\\u00e9"}'
+    assert text.encode("utf-8")
+    assert serialization.loads(text) == record
@@ -1,5 +1,6 @@
 """Tests for state management."""
 
+import json
 import sqlite3
 import tempfile
 from pathlib import Path
@@ -70,3 +71,55 @@ def test_cursor_save_load() -> None:
 
     finally:
         Path(db_path).unlink(missing_ok=True)
+
+
+def test_upsert_items_collapses_repeats_in_batch() -> None:
+    """Test that repeated ids in one batch count once and keep the last payload."""
+    with tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False) as f:
+        db_path = f.name
+
+    try:
+        records = [
+            {"id": "001", "title": "First"},
+            {"id": "001", "title": "Second"},
+            {"id": "", "title": "No id"},
+        ]
+        assert upsert_items("test_job", records, db_path=db_path) == 1
+
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        first = conn.execute("SELECT * FROM items WHERE job = ?", ("test_job",)).fetchall()
+        conn.close()
+        assert len(first) == 1
+        assert '"Second"' in first[0]["payload_json"]
+
+        # Re-seeing the item updates payload and last_seen but keeps first_seen
+        assert upsert_items("test_job", [{"id": "001", "title": "Third"}], db_path=db_path) == 0
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM items WHERE job = ?", ("test_job",)).fetchone()
+        conn.close()
+        assert '"Third"' in row["payload_json"]
+        assert row["first_seen"] == first[0]["first_seen"]
+
+    finally:
+        Path(db_path).unlink(missing_ok=True)
+
+
+def test_upsert_items_stores_lone_surrogates() -> None:
+    """Test that a payload with a lone surrogate is stored and reads back intact."""
+    with tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False) as f:
+        db_path = f.name
+
+    try:
+        record = {"id": "001", "title": "Broken \ud800 text"}
+        assert upsert_items("test_job", [record], db_path=db_path) == 1
+
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM items WHERE job = ?", ("test_job",)).fetchone()
+        conn.close()
+        assert json.loads(row["payload_json"]) == record
+
+    finally:
+        Path(db_path).unlink(missing_ok=True)